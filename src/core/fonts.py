@@ -0,0 +1,26 @@
+"""Cached TrueType font loading shared by the display and UI layers."""
+
+import functools
+import logging
+
+from PIL import ImageFont
+
+log = logging.getLogger("push2reaper.core.fonts")
+
+FONT_REGULAR = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+FONT_BOLD = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+
+
+@functools.lru_cache(maxsize=None)
+def get_font(path: str, size: int) -> ImageFont.FreeTypeFont:
+    """Load a TrueType font, cached per (path, size).
+
+    Raises OSError if the file can't be loaded. There is no bitmap font
+    fallback: the screen layouts and text caches assume DejaVu metrics.
+    """
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        log.error("Font %s not found. Install the DejaVu fonts "
+                  "(Debian/Ubuntu: apt install fonts-dejavu-core)", path)
+        raise
@@ -20,6 +20,7 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 from config import load_config
 from core.logging_config import setup_logging
 from core.event_bus import EventBus
+from push2.display import pillow_build
 from push2.hardware import Push2Hardware
 from push2.scales import ScaleState
 from push2.buttons import BUTTON_NAME_LOOKUP
@@ -343,7 +344,7 @@ class Push2ReaperDaemon:
     def _on_state_changed(self, data: dict) -> None:
         self._mode.on_state_changed(self, data or {})
         # Always update transport LEDs regardless of mode
-        if data and data.get("type") == "transport":
+        if data and "transport" in data.get("kinds", ()):
             if self.push2.buttons:
                 self.push2.buttons.set_transport_state(
                     self.state.playing, self.state.recording
@@ -380,7 +381,7 @@ class Push2ReaperDaemon:
             )
 
         frame_interval = 1.0 / self._fps
-        log.info("Starting display at %d fps", self._fps)
+        log.info("Starting display at %d fps (%s)", self._fps, pillow_build())
         log.info("OSC: sending to %s:%d, listening on :%d",
                  self.osc_client.ip, self.osc_client.port,
                  self.osc_server.port)
@@ -389,6 +390,7 @@ class Push2ReaperDaemon:
         try:
             while self._running:
                 try:
+                    self.state.flush_changes()
                     frame = self._mode.render(self)
                     self.push2.display.send_frame(frame)
                 except Exception:
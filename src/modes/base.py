@@ -11,6 +11,8 @@ from typing import TYPE_CHECKING
 from PIL import Image
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from main import Push2ReaperDaemon
 
 
@@ -44,6 +46,7 @@ class Mode:
     def on_state_changed(self, daemon: Push2ReaperDaemon, data: dict) -> None:
         """Handle Reaper state change (for updating LEDs etc)."""
 
-    def render(self, daemon: Push2ReaperDaemon) -> Image.Image:
-        """Render the display for this mode. Must return 960x160 RGB image."""
+    def render(self, daemon: Push2ReaperDaemon) -> Image.Image | np.ndarray:
+        """Render the display for this mode. Must return 960x160 RGB image,
+        or a frame already packed by push2.display.pil_to_bgr565()."""
         return Image.new("RGB", (960, 160), (0, 0, 0))
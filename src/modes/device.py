@@ -35,6 +35,8 @@ class DeviceMode(Mode):
     def enter(self, daemon: Push2ReaperDaemon) -> None:
         log.info("Entering device mode (FX %d, param bank %d)",
                  self._fx_idx, self._param_bank)
+        # State changes aren't tracked while another mode is active
+        self._screen.invalidate()
         self._update_buttons(daemon)
 
     def exit(self, daemon: Push2ReaperDaemon) -> None:
@@ -135,7 +137,10 @@ class DeviceMode(Mode):
             daemon.osc_client.poly_aftertouch(0, virtual_note, value)
 
     def on_state_changed(self, daemon: Push2ReaperDaemon, data: dict) -> None:
-        if data.get("type") == "transport":
+        if self._screen.needs_redraw(data.get("changes", ()),
+                                     daemon.state.selected_track, self._fx_idx):
+            self._screen.invalidate()
+        if "transport" in data.get("kinds", ()):
             if daemon.push2.buttons:
                 daemon.push2.buttons.set_transport_state(
                     daemon.state.playing, daemon.state.recording
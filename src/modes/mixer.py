@@ -158,7 +158,7 @@ class MixerMode(Mode):
             daemon.osc_client.poly_aftertouch(0, virtual_note, value)
 
     def on_state_changed(self, daemon: Push2ReaperDaemon, data: dict) -> None:
-        if data and data.get("type") == "transport":
+        if data and "transport" in data.get("kinds", ()):
             if daemon.push2.buttons:
                 daemon.push2.buttons.set_transport_state(
                     daemon.state.playing, daemon.state.recording
@@ -10,17 +10,18 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+import numpy as np
 import push2_python.constants as c
-from PIL import Image
 
 from modes.base import Mode
 from push2.buttons import UPPER_ROW, LOWER_ROW
+from push2.display import pil_to_bgr565
 from push2.encoders import EncoderManager, MASTER_ENCODER, TEMPO_ENCODER
 from playtime.client import (
     PlaytimeClient, SLOT_EMPTY, SLOT_STOPPED, SLOT_PLAYING,
     SLOT_RECORDING, SLOT_QUEUED,
 )
-from ui.session_screen import SessionScreen
+from ui.session_screen import SessionScreenAsync
 
 if TYPE_CHECKING:
     from main import Push2ReaperDaemon
@@ -43,7 +44,8 @@ class SessionMode(Mode):
     name = "session"
 
     def __init__(self):
-        self._screen = SessionScreen()
+        # Frames are packed to BGR565 on the render thread, once per change
+        self._screen = SessionScreenAsync(convert=pil_to_bgr565)
         self._scene_offset = 0  # First visible scene row
         self._daemon = None  # Set during enter(), used for streaming callbacks
 
@@ -51,6 +53,7 @@ class SessionMode(Mode):
         log.info("Entering session mode (scenes %d-%d)",
                  self._scene_offset + 1, self._scene_offset + 8)
         self._daemon = daemon
+        self._screen.start()
         # Subscribe to playtime state changes for real-time pad updates
         daemon.event_bus.subscribe("playtime_state_changed",
                                    self._on_playtime_changed)
@@ -60,6 +63,7 @@ class SessionMode(Mode):
     def exit(self, daemon: Push2ReaperDaemon) -> None:
         log.info("Exiting session mode")
         self._daemon = None
+        self._screen.stop()
         daemon.event_bus.unsubscribe("playtime_state_changed",
                                       self._on_playtime_changed)
         if daemon.push2.pads:
@@ -137,13 +141,13 @@ class SessionMode(Mode):
         self._update_pad_colors(daemon)
 
     def on_state_changed(self, daemon: Push2ReaperDaemon, data: dict) -> None:
-        if data.get("type") == "transport":
+        if "transport" in data.get("kinds", ()):
             if daemon.push2.buttons:
                 daemon.push2.buttons.set_transport_state(
                     daemon.state.playing, daemon.state.recording
                 )
 
-    def render(self, daemon: Push2ReaperDaemon) -> Image.Image:
+    def render(self, daemon: Push2ReaperDaemon) -> np.ndarray:
         # Get clip states from Playtime client
         pt = daemon.playtime
         clip_states = pt.get_grid_state(
@@ -165,13 +169,15 @@ class SessionMode(Mode):
                 name = reaper_tracks[i].name if i < len(reaper_tracks) else ""
             track_names.append(name)
 
-        return self._screen.render(
+        # Rendered on the screen's worker thread; show the newest finished frame
+        self._screen.submit(
             track_names, self._scene_offset, clip_states,
             clip_names=clip_names,
             connected=pt.is_connected,
             num_columns=pt.num_columns,
             num_rows=pt.num_rows,
         )
+        return self._screen.latest()
 
     def _on_playtime_changed(self, data: dict) -> None:
         """Called when Playtime state changes (from streaming thread)."""
@@ -192,9 +198,8 @@ class SessionMode(Mode):
             num_cols=8, num_rows=8,
             col_offset=0, row_offset=self._scene_offset,
         )
-        for row in range(8):
-            for col in range(8):
-                state = grid[row][col] if row < len(grid) and col < len(grid[row]) else SLOT_EMPTY
+        for row, states in enumerate(grid.tolist()):
+            for col, state in enumerate(states):
                 color = PAD_COLORS.get(state, "dark_gray")
                 push.pads.set_pad_color((row, col), color)
 
@@ -12,6 +12,7 @@ import threading
 from typing import TYPE_CHECKING
 
 import grpc
+import numpy as np
 
 from playtime import helgobox_pb2 as pb
 from playtime import helgobox_pb2_grpc as pb_grpc
@@ -248,25 +249,26 @@ class PlaytimeClient:
         return grid
 
     def get_grid_state(self, num_cols: int = 8, num_rows: int = 8,
-                       col_offset: int = 0, row_offset: int = 0) -> list[list[int]]:
+                       col_offset: int = 0, row_offset: int = 0) -> np.ndarray:
         """Get an 8x8 grid of slot states for the display.
 
-        Returns grid[row][col] to match session mode's grid layout.
+        Returns a (num_rows, num_cols) uint8 array indexed [row, col] to
+        match session mode's grid layout.
         Slots with content but stopped show as SLOT_STOPPED (1).
         Slots without content show as SLOT_EMPTY (0).
         """
-        grid = []
+        grid = np.zeros((num_rows, num_cols), dtype=np.uint8)
+        slot_states = self.slot_states
+        has_content = self.slot_has_content
         for row in range(num_rows):
-            row_states = []
+            ar = row + row_offset
             for col in range(num_cols):
                 ac = col + col_offset
-                ar = row + row_offset
-                state = self.slot_states.get((ac, ar), SLOT_EMPTY)
+                state = slot_states.get((ac, ar), SLOT_EMPTY)
                 # If slot is "stopped" but has no content, show as empty
-                if state == SLOT_STOPPED and not self.slot_has_content.get((ac, ar), False):
-                    state = SLOT_EMPTY
-                row_states.append(state)
-            grid.append(row_states)
+                if state == SLOT_STOPPED and not has_content.get((ac, ar), False):
+                    continue
+                grid[row, col] = state
         return grid
 
     # --- Internal: initial state fetch ---
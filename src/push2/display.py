@@ -5,26 +5,52 @@ to the Push 2's 960x160 pixel display.
 """
 
 import logging
+from importlib import metadata
+
 import numpy as np
+import PIL
 from PIL import Image, ImageDraw, ImageFont
 from push2_python.constants import FRAME_FORMAT_BGR565
 
+from core.fonts import FONT_BOLD, FONT_REGULAR, get_font
+
 log = logging.getLogger("push2reaper.push2.display")
 
 WIDTH = 960
 HEIGHT = 160
 
 
-def pil_to_bgr565(img: Image.Image) -> np.ndarray:
-    """Convert a PIL RGB image to BGR565 uint16 numpy array (960, 160)."""
-    rgb = np.array(img.convert("RGB"))  # (160, 960, 3) uint8
+def pillow_build() -> str:
+    """Describe the installed Pillow build, e.g. "Pillow-SIMD 9.5.0.post1".
 
-    r = (rgb[:, :, 0] >> 3).astype(np.uint16)
-    g = (rgb[:, :, 1] >> 2).astype(np.uint16)
-    b = (rgb[:, :, 2] >> 3).astype(np.uint16)
+    PIL.features doesn't report SIMD support, so this checks which
+    distribution is installed: Pillow-SIMD ships the same PIL package
+    under its own name.
+    """
+    try:
+        metadata.version("Pillow-SIMD")
+    except metadata.PackageNotFoundError:
+        name = "Pillow"
+    else:
+        name = "Pillow-SIMD"
+    return f"{name} {PIL.__version__}"
 
-    # BGR565: BBBBB_GGGGGG_RRRRR
-    bgr565 = (b << 11) | (g << 5) | r  # (160, 960)
+
+def pil_to_bgr565(img: Image.Image) -> np.ndarray:
+    """Convert a PIL RGB image to BGR565 uint16 numpy array (960, 160)."""
+    if img.mode != "RGB":
+        img = img.convert("RGB")
+    rgb = np.asarray(img)  # (160, 960, 3) uint8
+
+    # BGR565: BBBBB_GGGGGG_RRRRR, packed in place into one uint16 array
+    bgr565 = rgb[:, :, 2].astype(np.uint16)  # (160, 960)
+    bgr565 &= 0xF8
+    bgr565 <<= 8
+    g = rgb[:, :, 1].astype(np.uint16)
+    g &= 0xFC
+    g <<= 3
+    bgr565 |= g
+    bgr565 |= rgb[:, :, 0] >> 3
 
     # push2-python expects shape (960, 160) — transposed
     return bgr565.T
@@ -41,17 +67,15 @@ class Push2Display:
 
     def _load_fonts(self) -> None:
         """Load fonts for display rendering."""
-        try:
-            self._font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16)
-            self._font_small = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 12)
-        except OSError:
-            log.warning("DejaVu fonts not found, using default bitmap font")
-            self._font = ImageFont.load_default()
-            self._font_small = self._font
-
-    def send_frame(self, img: Image.Image) -> None:
-        """Convert PIL image and send to Push 2 display."""
-        frame = pil_to_bgr565(img)
+        self._font = get_font(FONT_BOLD, 16)
+        self._font_small = get_font(FONT_REGULAR, 12)
+
+    def send_frame(self, img: Image.Image | np.ndarray) -> None:
+        """Convert PIL image and send to Push 2 display.
+
+        Arrays are taken as already converted by pil_to_bgr565().
+        """
+        frame = img if isinstance(img, np.ndarray) else pil_to_bgr565(img)
         self._push.display.display_frame(frame, input_format=FRAME_FORMAT_BGR565)
 
     def send_black(self) -> None:
@@ -2,13 +2,14 @@
 
 import logging
 
+import numpy as np
+
 from push2.scales import ScaleState
 
 log = logging.getLogger("push2reaper.push2.pads")
 
 COLOR_HIGHLIGHT = "white"  # pressed pad
 
-
 class PadManager:
     """Manages the 8x8 pad grid colors and state."""
 
@@ -43,13 +44,22 @@ class PadManager:
         self._colors = [[""] * self.COLS for _ in range(self.ROWS)]
 
     def rebuild_grid(self) -> None:
-        """Recalculate and repaint pad colors from current scale state."""
-        for r in range(self.ROWS):
-            for c in range(self.COLS):
-                note = self._scale.pad_note(r, c)
-                color = self._scale.note_color(note)
-                self._grid_colors[r][c] = color
-                self.set_color(r, c, color)
+        """Recalculate and repaint pad colors from current scale state.
+
+        Colors are looked up per semitone (12 entries) instead of per pad,
+        and only pads whose color differs from the cached one are sent.
+        """
+        s = self._scale
+        notes = s.pad_notes()
+        color_lut = np.array([s.note_color(n) for n in range(12)])
+        new_colors = color_lut[notes % 12]
+        self._grid_colors = new_colors.tolist()
+
+        changed = np.argwhere(new_colors != np.array(self._colors))
+        for r, c in changed.tolist():
+            color = self._grid_colors[r][c]
+            self._push.pads.set_pad_color((r, c), color)
+            self._colors[r][c] = color
         log.info("Pad grid: %s %s (oct=%+d)",
                  self._scale.root_name, self._scale.scale_name,
                  self._scale.octave_offset)
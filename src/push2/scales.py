@@ -2,6 +2,8 @@
 
 import logging
 
+import numpy as np
+
 log = logging.getLogger("push2reaper.push2.scales")
 
 # Scale definitions: name -> tuple of semitone offsets from root
@@ -38,6 +40,9 @@ LAYOUTS = {
 }
 LAYOUT_LIST = list(LAYOUTS.keys())
 
+# Row/col index grids for pad_notes()
+_ROW_IDX, _COL_IDX = np.indices((8, 8))
+
 # Total pages in scale mode
 SCALE_PAGES = (len(SCALE_LIST) + 7) // 8  # ceil division
 TOTAL_PAGES = SCALE_PAGES + 1  # last page is settings
@@ -96,6 +101,10 @@ class ScaleState:
         """
         return self.base_note + (7 - row) * self.row_interval + col
 
+    def pad_notes(self) -> np.ndarray:
+        """pad_note() for the whole grid, as an 8x8 array indexed [row, col]."""
+        return self.base_note + (7 - _ROW_IDX) * self.row_interval + _COL_IDX
+
     def note_color(self, midi_note: int) -> str:
         """Determine pad color based on scale membership."""
         semitone = midi_note % 12
@@ -4,7 +4,11 @@ Sends OSC messages to Reaper DAW for transport control,
 track parameters, navigation, etc.
 """
 
+import functools
 import logging
+
+from pythonosc.osc_message import OscMessage
+from pythonosc.osc_message_builder import OscMessageBuilder
 from pythonosc.udp_client import SimpleUDPClient
 
 log = logging.getLogger("push2reaper.reaper.osc_client")
@@ -13,6 +17,24 @@ log = logging.getLogger("push2reaper.reaper.osc_client")
 VOLUME_STEP = 0.015  # ~1.5% per tick
 PAN_STEP = 0.02      # ~2% per tick
 
+# Reaper action IDs
+ACTION_UNDO = 40029
+ACTION_REDO = 40030
+
+
+@functools.lru_cache(maxsize=256, typed=True)
+def _build_message(address: str, args: tuple = (),
+                   arg_types: tuple = ()) -> OscMessage:
+    """Build (and cache) an OSC message for a constant address/args pair.
+
+    arg_types (the type of each arg) only extends the cache key: 0, 0.0
+    and False are equal as tuple members, but encode as ,i / ,f / ,F.
+    """
+    builder = OscMessageBuilder(address=address)
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build()
+
 
 class ReaperOSCClient:
     """Sends OSC messages to Reaper DAW."""
@@ -34,26 +56,38 @@ class ReaperOSCClient:
         log.debug("OSC SEND: %s %s", address, value)
         self._client.send_message(address, value)
 
+    def _send_const(self, address: str, *args) -> None:
+        """Send a message whose address and args never change.
+
+        The serialized datagram is cached, so repeated sends skip
+        OSC message building entirely.
+        """
+        if self._client is None:
+            log.warning("OSC client not connected, ignoring: %s", address)
+            return
+        log.debug("OSC SEND: %s %s", address, list(args))
+        self._client.send(_build_message(address, args, tuple(map(type, args))))
+
     # --- Transport ---
 
     def play(self) -> None:
-        self._send("/play")
+        self._send_const("/play")
 
     def stop(self) -> None:
-        self._send("/stop")
+        self._send_const("/stop")
 
     def record(self) -> None:
-        self._send("/record")
+        self._send_const("/record")
 
     def pause(self) -> None:
-        self._send("/pause")
+        self._send_const("/pause")
 
     def repeat(self) -> None:
-        self._send("/repeat")
+        self._send_const("/repeat")
 
     def click(self) -> None:
         """Toggle metronome."""
-        self._send("/click")
+        self._send_const("/click")
 
     # --- Track volume/pan (normalized 0.0-1.0) ---
 
@@ -82,33 +116,33 @@ class ReaperOSCClient:
     # --- Track mute/solo/select ---
 
     def toggle_track_mute(self, track_num: int) -> None:
-        self._send(f"/track/{track_num}/mute/toggle")
+        self._send_const(f"/track/{track_num}/mute/toggle")
 
     def toggle_track_solo(self, track_num: int) -> None:
-        self._send(f"/track/{track_num}/solo/toggle")
+        self._send_const(f"/track/{track_num}/solo/toggle")
 
     def toggle_track_rec_arm(self, track_num: int) -> None:
-        self._send(f"/track/{track_num}/recarm/toggle")
+        self._send_const(f"/track/{track_num}/recarm/toggle")
 
     def select_track(self, track_num: int, bank_size: int = 8) -> None:
         """Exclusively select a track (deselects all others in the bank)."""
         for i in range(1, bank_size + 1):
             if i != track_num:
-                self._send(f"/track/{i}/select", 0)
-        self._send(f"/track/{track_num}/select", 1)
+                self._send_const(f"/track/{i}/select", 0)
+        self._send_const(f"/track/{track_num}/select", 1)
 
     def select_and_arm_track(self, track_num: int, bank_size: int = 8) -> None:
         """Exclusively select and record-arm a track (disarms all others)."""
         for i in range(1, bank_size + 1):
             if i != track_num:
-                self._send(f"/track/{i}/select", 0)
-                self._send(f"/track/{i}/recarm", 0)
-        self._send(f"/track/{track_num}/select", 1)
-        self._send(f"/track/{track_num}/recarm", 1)
+                self._send_const(f"/track/{i}/select", 0)
+                self._send_const(f"/track/{i}/recarm", 0)
+        self._send_const(f"/track/{track_num}/select", 1)
+        self._send_const(f"/track/{track_num}/recarm", 1)
 
     def solo_reset(self) -> None:
         """Clear all solos."""
-        self._send("/soloreset")
+        self._send_const("/soloreset")
 
     # --- Master ---
 
@@ -124,16 +158,16 @@ class ReaperOSCClient:
     # --- Bank navigation ---
 
     def next_track_bank(self) -> None:
-        self._send("/device/track/bank/+")
+        self._send_const("/device/track/bank/+")
 
     def prev_track_bank(self) -> None:
-        self._send("/device/track/bank/-")
+        self._send_const("/device/track/bank/-")
 
     def next_track(self) -> None:
-        self._send("/device/track/+")
+        self._send_const("/device/track/+")
 
     def prev_track(self) -> None:
-        self._send("/device/track/-")
+        self._send_const("/device/track/-")
 
     # --- Tempo ---
 
@@ -148,7 +182,7 @@ class ReaperOSCClient:
 
     def note_off(self, channel: int, note: int) -> None:
         """Send MIDI note-off via Reaper's virtual keyboard OSC input."""
-        self._send(f"/vkb_midi/{channel}/note/{note}", 0)
+        self._send_const(f"/vkb_midi/{channel}/note/{note}", 0)
 
     # --- Send controls ---
 
@@ -175,7 +209,7 @@ class ReaperOSCClient:
 
     def set_track_automode(self, track_num: int, mode: int) -> None:
         """Set track automation mode (0=trim, 1=read, 2=touch, 3=write, 4=latch)."""
-        self._send(f"/track/{track_num}/automode/{mode}")
+        self._send_const(f"/track/{track_num}/automode/{mode}")
 
     # --- FX / Device control ---
 
@@ -211,12 +245,12 @@ class ReaperOSCClient:
 
     def undo(self) -> None:
         """Trigger Reaper undo (action 40029)."""
-        self._send("/action", 40029)
+        self._send_const("/action", ACTION_UNDO)
 
     def redo(self) -> None:
         """Trigger Reaper redo (action 40030)."""
-        self._send("/action", 40030)
+        self._send_const("/action", ACTION_REDO)
 
     def trigger_action(self, action_id: int) -> None:
         """Trigger a Reaper action by its command ID."""
-        self._send("/action", action_id)
+        self._send_const("/action", action_id)
@@ -1,31 +1,180 @@
 """Reaper OSC feedback server.
 
 Listens for OSC messages from Reaper and updates ReaperState.
-Runs in a background thread.
+Runs in a single background thread that drains the UDP socket in
+batches, so a burst of meter feedback costs one wakeup rather than
+one thread per datagram.
 
 NOTE: python-osc's Dispatcher.map() passes extra args as a list in the
 second callback parameter: callback(address, [extra_args], *osc_values).
 All handlers must account for this.
 """
 
+import functools
+import itertools
 import logging
 import re
+import select
+import socket
+import struct
 import threading
 
-from pythonosc.dispatcher import Dispatcher
-from pythonosc.osc_server import ThreadingOSCUDPServer
+from pythonosc import osc_packet
+from pythonosc.dispatcher import Dispatcher, Handler
 
 from reaper.state import ReaperState
 
 log = logging.getLogger("push2reaper.reaper.osc_server")
 
-# Regex to extract track number from OSC paths like /track/3/volume
-_TRACK_RE = re.compile(r"^/track/(\d+)/(.+)$")
-# Regex for send paths like /track/3/send/2/volume
-_SEND_RE = re.compile(r"^/track/(\d+)/send/(\d+)/(.+)$")
-# Regex for FX paths like /track/3/fx/1/fxparam/2/value
-_FX_RE = re.compile(r"^/track/(\d+)/fx/(\d+)/(.+)$")
-_FX_PARAM_RE = re.compile(r"^/track/(\d+)/fx/(\d+)/fxparam/(\d+)/(.+)$")
+# One regex for every indexed track path:
+#   /track/3/volume, /track/3/send/2/volume, /track/3/fx/1/name,
+#   /track/3/fx/1/fxparam/2/value
+_ADDR_RE = re.compile(
+    r"^/track/(\d+)(?:/send/(\d+)|/fx/(\d+)(?:/fxparam/(\d+))?)?/(.+)$"
+)
+# Max datagrams drained per wakeup, and max datagram size (as socketserver)
+_RECV_BATCH = 64
+_MAX_PACKET_SIZE = 8192
+# How often the reader thread re-checks for shutdown while idle (seconds)
+_POLL_INTERVAL = 0.5
+
+# Single-float OSC message: padded address, ",f" type tag, big-endian float32
+_FLOAT = struct.Struct(">f")
+_FLOAT_TAG = b",f\0\0"
+
+# Track fields whose feedback records no change (and so no redraw) while
+# the mixer would draw it the same; the value itself is always stored.
+# Steps per field are the pixel resolution it is drawn at: FADER_H for the
+# meters and PAN_W for the pan dot (ui/screens.py, which this layer doesn't
+# import). Meters also turn red at _VU_HOT (VU_HOT there); pan crossing it
+# only costs a spare redraw.
+_QUANTIZED_STEPS = {"vu": 94, "vu_l": 94, "vu_r": 94, "pan": 50}
+_VU_HOT = 0.8
+# Numeric path segments, replaced by "#" to form an address template
+_NUM_SEGMENT_RE = re.compile(r"/\d+(?=/|$)")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_track_address(address: str) -> tuple[int, int | None, int | None, int | None] | None:
+    """Parse the indices out of a /track/... address (1-indexed, as sent).
+
+    Returns (track, send, fx, param) with None for absent parts, or None
+    if the address is not a track path. Reaper only ever sends a bounded
+    set of addresses, so results are cached and each distinct address is
+    regex-matched once.
+    """
+    m = _ADDR_RE.match(address)
+    if m is None:
+        return None
+    track, send, fx, param = m.group(1, 2, 3, 4)
+    return (int(track),
+            int(send) if send else None,
+            int(fx) if fx else None,
+            int(param) if param else None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _address_template(address: str) -> str:
+    """Canonicalize an address: /track/3/send/2/volume → /track/#/send/#/volume.
+
+    Mapped patterns use "*" for index segments, which is normalized the
+    same way, so incoming messages and mappings share one key space.
+    """
+    return _NUM_SEGMENT_RE.sub("/#", address).replace("*", "#")
+
+
+def _parse_float_message(data: bytes) -> tuple[str, float] | None:
+    """Decode a plain ",f" OSC message without python-osc's generic parser.
+
+    Returns (address, value), or None for anything else (bundles, other
+    type tags, malformed data) so the caller can fall back.
+    """
+    if data[:1] != b"/":
+        return None
+    end = data.find(b"\0")
+    if end < 0:
+        return None
+    tag = (end + 4) & ~3  # address is NUL-terminated, padded to 4 bytes
+    if len(data) != tag + 8 or data[tag:tag + 4] != _FLOAT_TAG:
+        return None
+    try:
+        address = data[:end].decode("utf-8")
+    except UnicodeDecodeError:
+        return None
+    return address, _FLOAT.unpack_from(data, tag + 4)[0]
+
+
+class TemplateDispatcher(Dispatcher):
+    """Dispatcher that looks handlers up by address template.
+
+    python-osc's Dispatcher matches every incoming address against every
+    mapped pattern. Here an address is canonicalized once and resolved
+    with a single dict lookup. Only "*" standing in for a whole numeric
+    segment is supported, which is all Reaper's OSC paths need. Unlike
+    glob matching, "/track/*/volume" no longer matches send volumes.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._templates: dict[str, list[Handler]] = {}
+        self._fast_path = None
+
+    def set_fast_path(self, fast_path) -> None:
+        """Install fast_path(address, args) -> bool, tried before lookup.
+
+        When it returns True the message counts as handled and the
+        regular handlers are skipped.
+        """
+        self._fast_path = fast_path
+
+    def map(self, address: str, handler, *args,
+            needs_reply_address: bool = False) -> Handler:
+        handler_obj = super().map(address, handler, *args,
+                                  needs_reply_address=needs_reply_address)
+        self._templates.setdefault(_address_template(address), []).append(handler_obj)
+        return handler_obj
+
+    def unmap(self, address: str, handler, *args,
+              needs_reply_address: bool = False) -> None:
+        super().unmap(address, handler, *args,
+                      needs_reply_address=needs_reply_address)
+        self._templates[_address_template(address)] = list(self._map[address])
+
+    def handlers_for_address(self, address_pattern: str) -> list[Handler]:
+        handlers = self._templates.get(_address_template(address_pattern))
+        if handlers:
+            return handlers
+        if self._default_handler:
+            return [self._default_handler]
+        return []
+
+    def call_handlers_for_packet(self, data: bytes,
+                                 client_address: tuple[str, int]) -> list:
+        """Like Dispatcher.call_handlers_for_packet, trying the fast path first.
+
+        Single-float messages are decoded with _parse_float_message so
+        the fast path skips python-osc's parser entirely. Bundle timetags
+        are ignored (Reaper doesn't schedule feedback).
+        """
+        results = []
+        fast_path = self._fast_path
+        if fast_path is not None:
+            parsed = _parse_float_message(data)
+            if parsed is not None and fast_path(parsed[0], (parsed[1],)):
+                return results
+        try:
+            packet = osc_packet.OscPacket(data)
+        except osc_packet.ParseError:
+            return results
+        for timed_msg in packet.messages:
+            message = timed_msg.message
+            if fast_path is not None and fast_path(message.address, message.params):
+                continue
+            for handler in self.handlers_for_address(message.address):
+                result = handler.invoke(client_address, message)
+                if result is not None:
+                    results.append(result)
+        return results
 
 
 class ReaperOSCServer:
@@ -34,20 +183,24 @@ class ReaperOSCServer:
     def __init__(self, port: int = 9000, state: ReaperState = None):
         self.port = port
         self.state = state
-        self._server: ThreadingOSCUDPServer | None = None
+        self._sock: socket.socket | None = None
+        self._dispatcher: TemplateDispatcher | None = None
         self._thread: threading.Thread | None = None
-        self._msg_count = 0
+        self._running = False
+        self._msg_count = itertools.count(1)
+        self._suppressed = False
 
     def start(self) -> None:
         """Start listening for OSC feedback in a background thread."""
-        dispatcher = Dispatcher()
-        self._setup_handlers(dispatcher)
+        self._dispatcher = TemplateDispatcher()
+        self._setup_handlers(self._dispatcher)
 
-        self._server = ThreadingOSCUDPServer(
-            ("0.0.0.0", self.port), dispatcher
-        )
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.bind(("0.0.0.0", self.port))
+        self._sock.setblocking(False)
+        self._running = True
         self._thread = threading.Thread(
-            target=self._server.serve_forever,
+            target=self._serve,
             name="osc-server",
             daemon=True,
         )
@@ -55,13 +208,143 @@ class ReaperOSCServer:
         log.info("OSC feedback server listening on :%d", self.port)
 
     def stop(self) -> None:
-        if self._server:
-            self._server.shutdown()
+        if self._running:
+            self._running = False
+            if self._thread:
+                self._thread.join(timeout=_POLL_INTERVAL * 2)
+            self._sock.close()
             log.info("OSC feedback server stopped")
 
-    def _setup_handlers(self, d: Dispatcher) -> None:
+    def _serve(self) -> None:
+        """Reader loop: wait for data, then drain up to _RECV_BATCH datagrams."""
+        sock = self._sock
+        recvfrom = sock.recvfrom
+        handle_packet = self._dispatcher.call_handlers_for_packet
+        wait = select.select
+        while self._running:
+            ready, _, _ = wait((sock,), (), (), _POLL_INTERVAL)
+            if not ready:
+                continue
+            for _ in range(_RECV_BATCH):
+                try:
+                    data, client_address = recvfrom(_MAX_PACKET_SIZE)
+                except (BlockingIOError, InterruptedError):
+                    break
+                except OSError:
+                    if self._running:
+                        log.exception("OSC socket error")
+                    return
+                try:
+                    handle_packet(data, client_address)
+                except Exception:
+                    log.exception("Error handling OSC packet")
+
+    def _setup_handlers(self, d: TemplateDispatcher) -> None:
         """Register OSC message handlers."""
 
+        # --- Hot-path handlers ---
+        # Meter, fader and FX value feedback arrive thousands of times a
+        # second, so these are closures over the state and its update
+        # methods rather than bound methods walking self.state.* per call.
+        state = self.state
+        parse = _parse_track_address
+        quantized_steps = _QUANTIZED_STEPS
+        vu_hot = _VU_HOT
+        if state is not None:
+            track_arrays = state.track_arrays
+            update_track = state.update_track
+            update_send = state.update_send
+            update_fx_param = state.update_fx_param
+
+        def set_track_float(track_num: int, field: str, args) -> None:
+            if not args or state is None:
+                return
+            try:
+                val = float(args[0])
+            except (ValueError, TypeError):
+                return  # skip string values like "-52.7dB"
+            # Only accept normalized values (0.0-1.0) — reject dB values
+            # that leak through wildcard matching
+            if field in ("volume", "pan") and not (0.0 <= val <= 1.0):
+                return
+            if field.startswith("vu") and not (0.0 <= val <= 1.0):
+                return
+            # Store a meter/pan value that hasn't moved by a display-visible
+            # step without the lock or a change event. Single array element
+            # reads and writes are safe under the GIL; the bounds check
+            # stands in for ensure(), which ran when the track was created.
+            steps = quantized_steps.get(field)
+            if steps is not None:
+                cached = track_arrays.by_field[field]
+                if track_num < len(cached):
+                    old = cached[track_num]
+                    if (int(val * steps) == int(old * steps)
+                            and (val < vu_hot) == (old < vu_hot)):
+                        cached[track_num] = val
+                        return
+            update_track(track_num, **{field: val})
+
+        def on_track_float(address: str, extra_args: list, *args):
+            parsed = parse(address)
+            if parsed is not None:
+                set_track_float(parsed[0], extra_args[0], args)
+
+        def on_track_bool(address: str, extra_args: list, *args):
+            parsed = parse(address)
+            if parsed is not None and args and state is not None:
+                try:
+                    val = bool(int(float(args[0])))
+                except (ValueError, TypeError):
+                    return
+                update_track(parsed[0], **{extra_args[0]: val})
+
+        def on_send_float(address: str, extra_args: list, *args):
+            parsed = parse(address)
+            if parsed and parsed[1] and args and state is not None:
+                try:
+                    val = float(args[0])
+                    if not (0.0 <= val <= 1.0):
+                        return
+                    # send index: 1-indexed → 0-indexed
+                    update_send(parsed[0], parsed[1] - 1, **{extra_args[0]: val})
+                except (ValueError, TypeError):
+                    pass
+
+        def on_fx_param_value(address: str, *args):
+            osc_val = self._get_osc_value(args)
+            parsed = parse(address)
+            if parsed and parsed[3] and osc_val is not None and state is not None:
+                track_num, _, fx_num, param_num = parsed
+                try:
+                    val = float(osc_val)
+                    update_fx_param(track_num, fx_num - 1, param_num - 1, value=val)
+                except (ValueError, TypeError):
+                    pass
+
+        def fast_dispatch(address: str, args) -> bool:
+            """Handle /track/N/vu, /vu/L and /vu/R without the dispatcher.
+
+            Meter feedback is the bulk of the OSC stream; this parses the
+            track number by slicing. Returns False for anything else.
+            """
+            if not address.startswith("/track/"):
+                return False
+            if address.endswith("/vu"):
+                field, end = "vu", -3
+            elif address.endswith("/vu/L"):
+                field, end = "vu_l", -5
+            elif address.endswith("/vu/R"):
+                field, end = "vu_r", -5
+            else:
+                return False
+            num = address[7:end]
+            if not num.isdigit():
+                return False
+            set_track_float(int(num), field, args)
+            return True
+
+        d.set_fast_path(fast_dispatch)
+
         # --- Transport feedback ---
         d.map("/play", self._on_transport, "playing")
         d.map("/record", self._on_transport, "recording")
@@ -82,14 +365,14 @@ class ReaperOSCServer:
         d.map("/master/volume/str", self._on_master_str, "volume_str")
 
         # --- Track feedback (wildcard) ---
-        d.map("/track/*/volume", self._on_track_float, "volume")
-        d.map("/track/*/pan", self._on_track_float, "pan")
-        d.map("/track/*/vu", self._on_track_float, "vu")
-        d.map("/track/*/vu/L", self._on_track_float, "vu_l")
-        d.map("/track/*/vu/R", self._on_track_float, "vu_r")
-        d.map("/track/*/mute", self._on_track_bool, "mute")
-        d.map("/track/*/solo", self._on_track_bool, "solo")
-        d.map("/track/*/recarm", self._on_track_bool, "rec_arm")
+        d.map("/track/*/volume", on_track_float, "volume")
+        d.map("/track/*/pan", on_track_float, "pan")
+        d.map("/track/*/vu", on_track_float, "vu")
+        d.map("/track/*/vu/L", on_track_float, "vu_l")
+        d.map("/track/*/vu/R", on_track_float, "vu_r")
+        d.map("/track/*/mute", on_track_bool, "mute")
+        d.map("/track/*/solo", on_track_bool, "solo")
+        d.map("/track/*/recarm", on_track_bool, "rec_arm")
         d.map("/track/*/select", self._on_track_select)
         d.map("/track/*/name", self._on_track_str, "name")
         d.map("/track/*/volume/str", self._on_track_str, "volume_str")
@@ -98,23 +381,24 @@ class ReaperOSCServer:
         d.map("/track/*/automode", self._on_track_automode)
 
         # --- Send feedback ---
-        d.map("/track/*/send/*/volume", self._on_send_float, "volume")
-        d.map("/track/*/send/*/pan", self._on_send_float, "pan")
+        d.map("/track/*/send/*/volume", on_send_float, "volume")
+        d.map("/track/*/send/*/pan", on_send_float, "pan")
         d.map("/track/*/send/*/name", self._on_send_str, "name")
         d.map("/track/*/send/*/volume/str", self._on_send_str, "volume_str")
 
         # --- FX feedback ---
         d.map("/track/*/fx/*/name", self._on_fx_name)
-        d.map("/track/*/fx/*/fxparam/*/value", self._on_fx_param_value)
+        d.map("/track/*/fx/*/fxparam/*/value", on_fx_param_value)
         d.map("/track/*/fx/*/fxparam/*/name", self._on_fx_param_name)
 
         # Catch-all for debugging unknown messages
         d.set_default_handler(self._on_unknown)
 
-    def _extract_track_num(self, address: str) -> int | None:
+    @staticmethod
+    def _extract_track_num(address: str) -> int | None:
         """Extract track number from an OSC address."""
-        m = _TRACK_RE.match(address)
-        return int(m.group(1)) if m else None
+        parsed = _parse_track_address(address)
+        return parsed[0] if parsed else None
 
     # --- Transport handlers ---
     # python-osc callback signature: callback(address, extra_args_list, *osc_values)
@@ -180,41 +464,17 @@ class ReaperOSCServer:
 
     # --- Track handlers ---
 
-    def _on_track_float(self, address: str, extra_args: list, *args):
-        track_num = self._extract_track_num(address)
-        if track_num is not None and args and self.state:
-            field = extra_args[0]
-            try:
-                val = float(args[0])
-            except (ValueError, TypeError):
-                return  # skip string values like "-52.7dB"
-            # Only accept normalized values (0.0-1.0) — reject dB values
-            # that leak through wildcard matching
-            if field in ("volume", "pan") and not (0.0 <= val <= 1.0):
-                return
-            if field.startswith("vu") and not (0.0 <= val <= 1.0):
-                return
-            self.state.update_track(track_num, **{field: val})
-
-    def _on_track_bool(self, address: str, extra_args: list, *args):
-        track_num = self._extract_track_num(address)
-        if track_num is not None and args and self.state:
-            field = extra_args[0]
-            try:
-                val = bool(int(float(args[0])))
-            except (ValueError, TypeError):
-                return
-            self.state.update_track(track_num, **{field: val})
-
     def _on_track_select(self, address: str, *args):
         osc_val = self._get_osc_value(args)
         track_num = self._extract_track_num(address)
         if track_num is not None and osc_val is not None and self.state:
             selected = bool(int(osc_val))
-            self.state.update_track(track_num, selected=selected)
             if selected:
+                # Set before update_track() records the change, so the next
+                # snapshot captures this track's sends
                 self.state.selected_track = track_num
                 log.debug("Track %d selected", track_num)
+            self.state.update_track(track_num, selected=selected)
 
     def _on_track_str(self, address: str, extra_args: list, *args):
         track_num = self._extract_track_num(address)
@@ -238,25 +498,11 @@ class ReaperOSCServer:
 
     # --- Send handlers ---
 
-    def _on_send_float(self, address: str, extra_args: list, *args):
-        m = _SEND_RE.match(address)
-        if m and args and self.state:
-            track_num = int(m.group(1))
-            send_idx = int(m.group(2)) - 1  # 1-indexed → 0-indexed
-            field = extra_args[0]
-            try:
-                val = float(args[0])
-                if not (0.0 <= val <= 1.0):
-                    return
-                self.state.update_send(track_num, send_idx, **{field: val})
-            except (ValueError, TypeError):
-                pass
-
     def _on_send_str(self, address: str, extra_args: list, *args):
-        m = _SEND_RE.match(address)
-        if m and args and self.state:
-            track_num = int(m.group(1))
-            send_idx = int(m.group(2)) - 1
+        parsed = _parse_track_address(address)
+        if parsed and parsed[1] and args and self.state:
+            track_num = parsed[0]
+            send_idx = parsed[1] - 1
             field = extra_args[0]
             self.state.update_send(track_num, send_idx, **{field: str(args[0])})
 
@@ -264,32 +510,19 @@ class ReaperOSCServer:
 
     def _on_fx_name(self, address: str, *args):
         osc_val = self._get_osc_value(args)
-        m = _FX_RE.match(address)
-        if m and osc_val is not None and self.state:
-            track_num = int(m.group(1))
-            fx_idx = int(m.group(2)) - 1
+        parsed = _parse_track_address(address)
+        if parsed and parsed[2] and osc_val is not None and self.state:
+            track_num = parsed[0]
+            fx_idx = parsed[2] - 1
             self.state.update_fx(track_num, fx_idx, name=str(osc_val))
 
-    def _on_fx_param_value(self, address: str, *args):
-        osc_val = self._get_osc_value(args)
-        m = _FX_PARAM_RE.match(address)
-        if m and osc_val is not None and self.state:
-            track_num = int(m.group(1))
-            fx_idx = int(m.group(2)) - 1
-            param_idx = int(m.group(3)) - 1
-            try:
-                val = float(osc_val)
-                self.state.update_fx_param(track_num, fx_idx, param_idx, value=val)
-            except (ValueError, TypeError):
-                pass
-
     def _on_fx_param_name(self, address: str, *args):
         osc_val = self._get_osc_value(args)
-        m = _FX_PARAM_RE.match(address)
-        if m and osc_val is not None and self.state:
-            track_num = int(m.group(1))
-            fx_idx = int(m.group(2)) - 1
-            param_idx = int(m.group(3)) - 1
+        parsed = _parse_track_address(address)
+        if parsed and parsed[3] and osc_val is not None and self.state:
+            track_num, _, fx_num, param_num = parsed
+            fx_idx = fx_num - 1
+            param_idx = param_num - 1
             self.state.update_fx_param(track_num, fx_idx, param_idx, name=str(osc_val))
 
     def _on_track_color(self, address: str, *args):
@@ -309,12 +542,14 @@ class ReaperOSCServer:
                 pass
 
     def _on_unknown(self, address: str, *args):
-        log.debug("Unknown OSC: %s %s", address, args)
-        self._msg_count += 1
-        if self._msg_count <= 5:
+        if self._suppressed:
+            return
+        n = next(self._msg_count)
+        if n <= 5:
             log.info("OSC received (unmatched): %s %s", address, args)
-        elif self._msg_count == 6:
+        elif n == 6:
             log.info("(suppressing further unmatched OSC logs)")
+            self._suppressed = True
 
     @staticmethod
     def _get_osc_value(args):
@@ -2,45 +2,149 @@
 
 Caches the current state of Reaper (tracks, transport, etc.)
 so the display can render without polling. Updated by the OSC
-feedback server.
+feedback server; changes are batched and published as a single
+state_changed event per display frame (see flush_changes()).
+
+Writers take the lock. The render path reads the current bank from an
+immutable BankSnapshot that flush_changes() swaps in once per frame,
+so it never contends with the OSC thread.
 """
 
 import logging
 import threading
+from typing import NamedTuple
+
+import numpy as np
 
 log = logging.getLogger("push2reaper.reaper.state")
 
 
-class TrackInfo:
-    """State for a single track."""
+class TrackArrays:
+    """Numeric per-track state stored as parallel NumPy arrays.
+
+    Index ``i`` holds track ``i`` (1-indexed, slot 0 unused), so a bank of
+    8 tracks is a plain slice of each array.
+    """
+
+    DEFAULTS = {
+        "volume": 0.716,  # ~0 dB
+        "pan": 0.5,       # center
+        "vu": 0.0,
+        "vu_l": 0.0,
+        "vu_r": 0.0,
+        "mute": False,
+        "solo": False,
+        "rec_arm": False,
+    }
+
+    def __init__(self, size: int):
+        self.volume = np.full(size, self.DEFAULTS["volume"])
+        self.pan = np.full(size, self.DEFAULTS["pan"])
+        self.vu = np.zeros(size)
+        self.vu_l = np.zeros(size)
+        self.vu_r = np.zeros(size)
+        self.mute = np.zeros(size, dtype=bool)
+        self.solo = np.zeros(size, dtype=bool)
+        self.rec_arm = np.zeros(size, dtype=bool)
+        self._index_fields()
+
+    def _index_fields(self) -> None:
+        self.by_field: dict[str, np.ndarray] = {
+            name: getattr(self, name) for name in self.DEFAULTS
+        }
+
+    def __len__(self) -> int:
+        return len(self.volume)
+
+    def ensure(self, index: int) -> None:
+        """Grow all arrays so that ``index`` is valid."""
+        size = len(self)
+        if index < size:
+            return
+        extra = index + 1 - size
+        for name, default in self.DEFAULTS.items():
+            arr = getattr(self, name)
+            setattr(self, name, np.concatenate(
+                (arr, np.full(extra, default, dtype=arr.dtype))
+            ))
+        self._index_fields()
+
+
+def _array_field(name: str, cast: type) -> property:
+    """TrackInfo attribute backed by the matching TrackArrays array."""
+
+    def fget(self):
+        return cast(getattr(self._arrays, name)[self.index])
+
+    def fset(self, value):
+        getattr(self._arrays, name)[self.index] = value
+
+    return property(fget, fset)
 
-    __slots__ = ("index", "name", "volume", "pan", "mute", "solo",
-                 "rec_arm", "selected", "vu", "vu_l", "vu_r",
-                 "volume_str", "pan_str", "color", "automode", "sends")
 
-    def __init__(self, index: int):
+class TrackInfo:
+    """State for a single track.
+
+    Numeric fields (volume, pan, VU, mute/solo/rec-arm) live in a shared
+    TrackArrays store; this object is a view onto row ``index``.
+    """
+
+    __slots__ = ("index", "_name", "display_name", "selected", "volume_str",
+                 "pan_str", "_color", "color_dim", "automode", "sends", "_arrays")
+    # Non-numeric fields settable through ReaperState.update_track()
+    _FIELDS = frozenset(("name", "selected", "volume_str", "pan_str",
+                         "color", "automode", "sends"))
+    # Characters of the name shown in a 120px display strip
+    DISPLAY_NAME_LEN = 10
+
+    volume = _array_field("volume", float)
+    pan = _array_field("pan", float)
+    vu = _array_field("vu", float)
+    vu_l = _array_field("vu_l", float)
+    vu_r = _array_field("vu_r", float)
+    mute = _array_field("mute", bool)
+    solo = _array_field("solo", bool)
+    rec_arm = _array_field("rec_arm", bool)
+
+    def __init__(self, index: int, arrays: TrackArrays | None = None):
         self.index = index
+        # A standalone TrackInfo gets its own private storage
+        self._arrays = arrays if arrays is not None else TrackArrays(index + 1)
         self.name = f"Track {index}"
-        self.volume = 0.716  # ~0 dB default
-        self.pan = 0.5       # center
-        self.mute = False
-        self.solo = False
-        self.rec_arm = False
         self.selected = False
-        self.vu = 0.0
-        self.vu_l = 0.0
-        self.vu_r = 0.0
         self.volume_str = "0.0 dB"
         self.pan_str = "<C>"
         self.color = None  # RGB tuple (r, g, b) from Reaper, or None for default
         self.automode = 0  # 0=trim, 1=read, 2=touch, 3=write, 4=latch
         self.sends: list[dict] = []  # [{name, volume, volume_str, pan}, ...]
 
+    @property
+    def name(self) -> str:
+        return self._name
+
+    @name.setter
+    def name(self, value: str) -> None:
+        # Truncate once per rename rather than on every rendered frame
+        self._name = value
+        self.display_name = value[:self.DISPLAY_NAME_LEN]
+
+    @property
+    def color(self) -> tuple[int, int, int] | None:
+        return self._color
+
+    @color.setter
+    def color(self, value: tuple[int, int, int] | None) -> None:
+        # Half-brightness variant for unselected strip headers
+        self._color = value
+        self.color_dim = tuple(c // 2 for c in value) if value else None
+
 
 class FXInfo:
     """State for a single FX plugin on a track."""
 
     __slots__ = ("index", "name", "params")
+    # Fields settable through ReaperState.update_fx()
+    _FIELDS = frozenset(("name", "params"))
 
     def __init__(self, index: int):
         self.index = index
@@ -48,17 +152,41 @@ class FXInfo:
         self.params: list[dict] = []  # [{name, value}, ...]
 
 
+class BankSnapshot(NamedTuple):
+    """The current bank as of the last flush_changes(). Treat as read-only."""
+
+    bank_offset: int
+    tracks: tuple[TrackInfo, ...]
+    levels: dict[str, np.ndarray]
+    # Copies of the selected track's send dicts
+    selected_sends: tuple[dict, ...]
+
+
 class ReaperState:
     """Thread-safe cache of Reaper DAW state."""
 
+    # Attributes settable through update_transport()
+    _TRANSPORT_FIELDS = frozenset((
+        "playing", "recording", "paused", "repeat",
+        "tempo", "tempo_str", "time_str", "beat_str",
+    ))
+    # update_master() key → attribute name
+    _MASTER_ATTRS = {
+        key: f"master_{key}" for key in ("volume", "pan", "vu", "volume_str")
+    }
+
     def __init__(self, event_bus=None, num_tracks: int = 64):
         self.event_bus = event_bus
         self._lock = threading.Lock()
 
         # Pre-allocate tracks (1-indexed to match Reaper OSC)
+        self.track_arrays = TrackArrays(num_tracks + 1)
         self.tracks: dict[int, TrackInfo] = {}
         for i in range(1, num_tracks + 1):
-            self.tracks[i] = TrackInfo(i)
+            self.tracks[i] = TrackInfo(i, self.track_arrays)
+        # Read-only stand-ins for bank slots past the last known track,
+        # built once per index so get_bank_tracks() doesn't allocate
+        self._placeholder_tracks: dict[int, TrackInfo] = {}
 
         # Transport state
         self.playing = False
@@ -86,55 +214,110 @@ class ReaperState:
         # Dirty flag for display updates
         self._dirty = True
 
+        # Change records since the last flush, e.g. ("track", 3),
+        # ("send", 3, 0), ("fx_param", 3, 0, 5), ("transport",).
+        # Published as one coalesced state_changed event per frame.
+        self._pending_changes: set[tuple] = set()
+
+        # Published bank view for lock-free reads; replaced (never
+        # mutated) by flush_changes()
+        self._snapshot = self._build_snapshot()
+
+    def _build_snapshot(self) -> BankSnapshot:
+        """Capture the current bank. Caller holds the lock (or is __init__)."""
+        start = self.bank_offset + 1  # 1-indexed
+        tracks = self.tracks
+        bank = [tracks.get(i) for i in range(start, start + 8)]
+        if None in bank:
+            placeholders = self._placeholder_tracks
+            for slot, track in enumerate(bank):
+                if track is None:
+                    i = start + slot
+                    track = placeholders.get(i)
+                    if track is None:
+                        track = placeholders[i] = TrackInfo(i)
+                    bank[slot] = track
+
+        self.track_arrays.ensure(start + 7)
+        levels = {
+            name: arr[start:start + 8].copy()
+            for name, arr in self.track_arrays.by_field.items()
+        }
+        selected = tracks.get(self.selected_track)
+        sends = tuple(dict(send) for send in selected.sends) if selected else ()
+        return BankSnapshot(self.bank_offset, tuple(bank), levels, sends)
+
     def get_bank_tracks(self) -> list[TrackInfo]:
-        """Get the 8 tracks in the current bank."""
-        with self._lock:
-            start = self.bank_offset + 1  # 1-indexed
-            return [self.tracks.get(i, TrackInfo(i)) for i in range(start, start + 8)]
+        """Get the 8 tracks in the current bank (as of the last flush)."""
+        return list(self._snapshot.tracks)
+
+    def get_bank_levels(self) -> dict[str, np.ndarray]:
+        """Get numeric fields of the 8 bank tracks as arrays.
+
+        Keys are TrackArrays field names (volume, pan, vu, mute, ...);
+        each value is an 8-element array captured at the last flush.
+        The arrays are shared between callers, so don't modify them.
+        """
+        return self._snapshot.levels
+
+    def get_selected_sends(self) -> tuple[dict, ...]:
+        """Get the selected track's sends (as of the last flush).
+
+        The dicts are copies shared between callers, so don't modify them.
+        """
+        return self._snapshot.selected_sends
+
+    def _get_or_create_track(self, track_num: int) -> TrackInfo:
+        """Return the TrackInfo for track_num, creating it if needed. Caller holds the lock."""
+        track = self.tracks.get(track_num)
+        if track is None:
+            self.track_arrays.ensure(track_num)
+            track = self.tracks[track_num] = TrackInfo(track_num, self.track_arrays)
+        return track
 
     def update_track(self, track_num: int, **kwargs) -> None:
         """Update a track's parameters."""
         with self._lock:
-            if track_num not in self.tracks:
-                self.tracks[track_num] = TrackInfo(track_num)
-            track = self.tracks[track_num]
+            track = self._get_or_create_track(track_num)
+            arrays = self.track_arrays.by_field
+            fields = TrackInfo._FIELDS
+            _setattr = object.__setattr__
             for key, value in kwargs.items():
-                if hasattr(track, key):
-                    setattr(track, key, value)
+                arr = arrays.get(key)
+                if arr is not None:
+                    arr[track_num] = value
+                elif key in fields:
+                    _setattr(track, key, value)
             self._dirty = True
-
-        if self.event_bus:
-            self.event_bus.publish("state_changed", {"type": "track", "track": track_num})
+            self._pending_changes.add(("track", track_num))
 
     def update_transport(self, **kwargs) -> None:
         """Update transport state."""
         with self._lock:
+            fields = self._TRANSPORT_FIELDS
+            _setattr = object.__setattr__
             for key, value in kwargs.items():
-                if hasattr(self, key):
-                    setattr(self, key, value)
+                if key in fields:
+                    _setattr(self, key, value)
             self._dirty = True
-
-        if self.event_bus:
-            self.event_bus.publish("state_changed", {"type": "transport"})
+            self._pending_changes.add(("transport",))
 
     def update_master(self, **kwargs) -> None:
         """Update master channel state."""
         with self._lock:
+            attrs = self._MASTER_ATTRS
+            _setattr = object.__setattr__
             for key, value in kwargs.items():
-                attr = f"master_{key}"
-                if hasattr(self, attr):
-                    setattr(self, attr, value)
+                attr = attrs.get(key)
+                if attr is not None:
+                    _setattr(self, attr, value)
             self._dirty = True
-
-        if self.event_bus:
-            self.event_bus.publish("state_changed", {"type": "master"})
+            self._pending_changes.add(("master",))
 
     def update_send(self, track_num: int, send_idx: int, **kwargs) -> None:
         """Update a track's send parameters."""
         with self._lock:
-            if track_num not in self.tracks:
-                self.tracks[track_num] = TrackInfo(track_num)
-            track = self.tracks[track_num]
+            track = self._get_or_create_track(track_num)
             # Extend sends list if needed
             while len(track.sends) <= send_idx:
                 track.sends.append({
@@ -145,11 +328,7 @@ class ReaperState:
                 })
             track.sends[send_idx].update(kwargs)
             self._dirty = True
-
-        if self.event_bus:
-            self.event_bus.publish("state_changed", {
-                "type": "send", "track": track_num, "send": send_idx
-            })
+            self._pending_changes.add(("send", track_num, send_idx))
 
     def update_fx(self, track_num: int, fx_idx: int, **kwargs) -> None:
         """Update FX plugin info."""
@@ -159,15 +338,14 @@ class ReaperState:
             fx_list = self.fx[track_num]
             while len(fx_list) <= fx_idx:
                 fx_list.append(FXInfo(len(fx_list)))
+            fx = fx_list[fx_idx]
+            fields = FXInfo._FIELDS
+            _setattr = object.__setattr__
             for key, value in kwargs.items():
-                if hasattr(fx_list[fx_idx], key):
-                    setattr(fx_list[fx_idx], key, value)
+                if key in fields:
+                    _setattr(fx, key, value)
             self._dirty = True
-
-        if self.event_bus:
-            self.event_bus.publish("state_changed", {
-                "type": "fx", "track": track_num, "fx": fx_idx
-            })
+            self._pending_changes.add(("fx", track_num, fx_idx))
 
     def update_fx_param(self, track_num: int, fx_idx: int,
                         param_idx: int, **kwargs) -> None:
@@ -183,20 +361,14 @@ class ReaperState:
                 fx.params.append({"name": f"Param {len(fx.params) + 1}", "value": 0.0})
             fx.params[param_idx].update(kwargs)
             self._dirty = True
-
-        if self.event_bus:
-            self.event_bus.publish("state_changed", {
-                "type": "fx_param", "track": track_num,
-                "fx": fx_idx, "param": param_idx
-            })
+            self._pending_changes.add(("fx_param", track_num, fx_idx, param_idx))
 
     def set_bank(self, offset: int) -> None:
         """Set the bank offset (0-indexed)."""
         with self._lock:
             self.bank_offset = max(0, offset)
             self._dirty = True
-        if self.event_bus:
-            self.event_bus.publish("state_changed", {"type": "bank"})
+            self._pending_changes.add(("bank",))
 
     def next_bank(self) -> None:
         self.set_bank(self.bank_offset + 8)
@@ -204,6 +376,25 @@ class ReaperState:
     def prev_bank(self) -> None:
         self.set_bank(self.bank_offset - 8)
 
+    def flush_changes(self) -> None:
+        """Publish one state_changed event covering all pending changes.
+
+        Called once per display frame, before rendering; also publishes a
+        fresh BankSnapshot for the render path. Event data is
+        ``{"changes": {change records}, "kinds": {"track", "transport", ...}}``.
+        """
+        with self._lock:
+            if not self._pending_changes:
+                return
+            changes, self._pending_changes = self._pending_changes, set()
+            self._snapshot = self._build_snapshot()
+
+        if self.event_bus:
+            self.event_bus.publish("state_changed", {
+                "changes": changes,
+                "kinds": {change[0] for change in changes},
+            })
+
     def consume_dirty(self) -> bool:
         """Check and clear dirty flag. Returns True if state changed."""
         with self._lock:
@@ -6,6 +6,8 @@ Shows a simple browser navigation interface for FX/presets.
 import logging
 from PIL import Image, ImageDraw, ImageFont
 
+from ui.fonts import FONT_BOLD, FONT_REGULAR, get_font
+
 log = logging.getLogger("push2reaper.ui.browser_screen")
 
 WIDTH = 960
@@ -17,6 +19,17 @@ TEXT_DIM = (120, 120, 120)
 ACCENT = (255, 120, 0)
 HIGHLIGHT = (60, 100, 200)
 
+DEFAULT_INSTRUCTIONS = [
+    "Encoder 1: Navigate browser items (prev/next)",
+    "Upper Row 1: Open FX browser for track",
+    "Upper Row 2: Open FX chain window",
+    "Upper Row 3: Add instrument to track",
+    "Lower Row: Select track",
+    "",
+    "Browser navigation requires Reaper's FX window.",
+    "Use the encoder to scroll through presets/FX.",
+]
+
 
 class BrowserScreen:
     """Renders the FX/preset browser display."""
@@ -26,57 +39,28 @@ class BrowserScreen:
         self._font_small: ImageFont.FreeTypeFont | None = None
         self._font_tiny: ImageFont.FreeTypeFont | None = None
         self._load_fonts()
+        # Frame-invariant backgrounds: header only, and header + default help
+        self._base_img = self._build_base()
+        self._default_img = self._base_img.copy()
+        self._draw_instructions(ImageDraw.Draw(self._default_img), DEFAULT_INSTRUCTIONS)
+        # Persistent frame buffer, reset from one of the backgrounds per redraw
+        self._img = self._base_img.copy()
+        self._draw = ImageDraw.Draw(self._img)
+        # Last rendered frame and the (track_name, instructions) it shows
+        self._last_key: tuple | None = None
+        self._last_img: Image.Image | None = None
 
-    def _load_fonts(self) -> None:
-        try:
-            self._font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14
-            )
-            self._font_small = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11
-            )
-            self._font_tiny = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 9
-            )
-        except OSError:
-            self._font = ImageFont.load_default()
-            self._font_small = self._font
-            self._font_tiny = self._font
-
-    def render(self, track_name: str, instructions: list[str] | None = None) -> Image.Image:
-        """Render browser mode display.
-
-        Args:
-            track_name: Current track name
-            instructions: List of help text lines
-        """
+    def _build_base(self) -> Image.Image:
         img = Image.new("RGB", (WIDTH, HEIGHT), BG)
         draw = ImageDraw.Draw(img)
-
-        # Header
         draw.rectangle([0, 0, WIDTH, 24], fill=(30, 30, 30))
         draw.text(
             (10, 12), "BROWSE",
             fill=ACCENT, font=self._font, anchor="lm",
         )
-        draw.text(
-            (150, 12), f"Track: {track_name}",
-            fill=TEXT, font=self._font_small, anchor="lm",
-        )
-
-        # Instructions
-        if instructions is None:
-            instructions = [
-                "Encoder 1: Navigate browser items (prev/next)",
-                "Upper Row 1: Open FX browser for track",
-                "Upper Row 2: Open FX chain window",
-                "Upper Row 3: Add instrument to track",
-                "Lower Row: Select track",
-                "",
-                "Browser navigation requires Reaper's FX window.",
-                "Use the encoder to scroll through presets/FX.",
-            ]
+        return img
 
+    def _draw_instructions(self, draw: ImageDraw.ImageDraw, instructions: list[str]) -> None:
         y = 36
         for line in instructions:
             if y > HEIGHT - 10:
@@ -85,4 +69,40 @@ class BrowserScreen:
                       anchor="lm")
             y += 16
 
+    def _load_fonts(self) -> None:
+        self._font = get_font(FONT_BOLD, 14)
+        self._font_small = get_font(FONT_REGULAR, 11)
+        self._font_tiny = get_font(FONT_REGULAR, 9)
+
+    def render(self, track_name: str, instructions: list[str] | None = None) -> Image.Image:
+        """Render browser mode display.
+
+        The output depends only on the arguments, so the previous frame is
+        returned as-is when they haven't changed. The returned image is a
+        persistent buffer, overwritten by the next redraw.
+
+        Args:
+            track_name: Current track name
+            instructions: List of help text lines
+        """
+        key = (track_name, tuple(instructions) if instructions is not None else None)
+        if key == self._last_key:
+            return self._last_img
+
+        img = self._img
+        draw = self._draw
+        if instructions is None:
+            img.paste(self._default_img)
+        else:
+            img.paste(self._base_img)
+            self._draw_instructions(draw, instructions)
+
+        # Header (bar and title are part of the base image)
+        draw.text(
+            (150, 12), f"Track: {track_name}",
+            fill=TEXT, font=self._font_small, anchor="lm",
+        )
+
+        self._last_key = key
+        self._last_img = img
         return img
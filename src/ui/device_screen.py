@@ -5,9 +5,13 @@ Shows the current FX plugin name and 8 parameter knobs with labels and values.
 
 import logging
 import math
+from collections import OrderedDict
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from reaper.state import ReaperState, FXInfo
+from ui.fonts import FONT_BOLD, FONT_REGULAR, draw_text, get_font
 
 log = logging.getLogger("push2reaper.ui.device_screen")
 
@@ -24,6 +28,39 @@ KNOB_BG = (40, 40, 40)
 KNOB_TRACK = (60, 60, 60)
 SEPARATOR = (50, 50, 50)
 
+HEADER_H = 24
+# Vertical band of a strip covered by a cached knob tile (name → value text)
+KNOB_TILE_TOP = HEADER_H + 1
+KNOB_TILE_BOTTOM = 120
+KNOB_TILE_CACHE_SIZE = 256
+
+KNOB_CY = 78
+KNOB_R = 22
+
+# cos/sin for each whole-degree knob position, 135° (min) to 405° (max)
+_ANGLE_COS = np.array([math.cos(math.radians(135 + i)) for i in range(271)])
+_ANGLE_SIN = np.array([math.sin(math.radians(135 + i)) for i in range(271)])
+
+
+def compute_knob_geometry(
+    values: np.ndarray, cx: np.ndarray, cy: int, r: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute indicator dot position and value-arc end angle for many knobs.
+
+    Args:
+        values: Normalized knob values (0.0–1.0)
+        cx: Knob centre x per value
+        cy: Knob centre y (shared)
+        r: Knob radius (shared)
+
+    Returns:
+        (dot_x, dot_y, end_angle) as int arrays, one entry per value.
+    """
+    steps = np.clip((values * 270).astype(int), 0, 270)
+    dot_x = cx + ((r - 2) * _ANGLE_COS[steps]).astype(int)
+    dot_y = cy + ((r - 2) * _ANGLE_SIN[steps]).astype(int)
+    return dot_x, dot_y, 135 + steps
+
 
 class DeviceScreen:
     """Renders FX parameter controls."""
@@ -33,35 +70,79 @@ class DeviceScreen:
         self._font_small: ImageFont.FreeTypeFont | None = None
         self._font_tiny: ImageFont.FreeTypeFont | None = None
         self._load_fonts()
+        self._base_img = self._build_base()
+        # Persistent frame buffer: reset from the base image each redraw
+        self._img = self._base_img.copy()
+        # (name, value) → rendered knob tile, most recently used last
+        self._knob_tiles: OrderedDict[tuple[str, float], Image.Image] = OrderedDict()
+        # Last rendered frame (self._img) and the (track, fx, bank) it
+        # shows; reused until invalidate() or different arguments
+        self._last_key: tuple[int, int, int] | None = None
+        self._last_img: Image.Image | None = None
+        # FX count shown in the last frame's "FX i/N" header
+        self._fx_count = 0
+
+    def _build_base(self) -> Image.Image:
+        """Pre-render the frame-invariant parts: header bar, title, separators."""
+        img = Image.new("RGB", (WIDTH, HEIGHT), BG)
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([0, 0, WIDTH, HEADER_H], fill=(30, 30, 30))
+        draw.text(
+            (10, 12), "DEVICE",
+            fill=ACCENT, font=self._font, anchor="lm",
+        )
+        for i in range(8):
+            x = i * STRIP_W
+            draw.line([x + STRIP_W - 1, HEADER_H, x + STRIP_W - 1, HEIGHT],
+                      fill=SEPARATOR)
+        return img
 
     def _load_fonts(self) -> None:
-        try:
-            self._font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14
-            )
-            self._font_small = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11
-            )
-            self._font_tiny = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 9
-            )
-        except OSError:
-            self._font = ImageFont.load_default()
-            self._font_small = self._font
-            self._font_tiny = self._font
+        self._font = get_font(FONT_BOLD, 14)
+        self._font_small = get_font(FONT_REGULAR, 11)
+        self._font_tiny = get_font(FONT_REGULAR, 9)
+
+    def needs_redraw(self, changes, track_num: int, fx_idx: int) -> bool:
+        """Whether any state change record affects this track/FX view.
+
+        A param record for an FX past the last drawn count also counts:
+        update_fx_param() grows the FX list, which changes the header.
+        """
+        for change in changes:
+            kind = change[0]
+            if kind == "track" or kind == "fx":
+                if change[1] == track_num:
+                    return True
+            elif kind == "fx_param":
+                if change[1] == track_num and (
+                        change[2] == fx_idx or change[2] >= self._fx_count):
+                    return True
+        return False
+
+    def invalidate(self) -> None:
+        """Force the next render() to redraw."""
+        self._last_img = None
 
     def render(self, state: ReaperState, track_num: int,
                fx_idx: int, param_bank: int) -> Image.Image:
         """Render device parameter screen.
 
+        Returns the previous frame unchanged when the arguments match and
+        invalidate() hasn't been called since. The returned image is a
+        persistent buffer, overwritten by the next redraw.
+
         Args:
             state: Reaper state
             track_num: Track number (1-indexed)
             fx_idx: FX index (0-based)
             param_bank: Parameter bank (0-based, 8 params per bank)
         """
-        img = Image.new("RGB", (WIDTH, HEIGHT), BG)
-        draw = ImageDraw.Draw(img)
+        key = (track_num, fx_idx, param_bank)
+        if self._last_img is not None and key == self._last_key:
+            return self._last_img
+
+        img = self._img
+        img.paste(self._base_img)
 
         track = state.tracks.get(track_num)
         track_name = track.name if track else f"Track {track_num}"
@@ -71,54 +152,80 @@ class DeviceScreen:
         fx = fx_list[fx_idx] if fx_idx < len(fx_list) else None
         fx_name = fx.name if fx else f"FX {fx_idx + 1}"
 
-        # Header
-        draw.rectangle([0, 0, WIDTH, 24], fill=(30, 30, 30))
-        draw.text(
-            (10, 12), f"DEVICE",
-            fill=ACCENT, font=self._font, anchor="lm",
-        )
-        draw.text(
-            (120, 12), f"{track_name} > {fx_name}",
+        # Header (bar and title are part of the base image)
+        draw_text(
+            img, (120, 12), f"{track_name} > {fx_name}",
             fill=TEXT, font=self._font_small, anchor="lm",
         )
 
         fx_count = len(fx_list)
-        draw.text(
-            (WIDTH - 10, 12),
+        self._fx_count = fx_count
+        draw_text(
+            img, (WIDTH - 10, 12),
             f"FX {fx_idx + 1}/{fx_count}" if fx_count > 0 else "No FX",
             fill=TEXT_DIM, font=self._font_small, anchor="rm",
         )
 
-        # Draw 8 parameter knobs
+        # Draw 8 parameter knobs (separators are part of the base image)
         params = fx.params if fx else []
         param_start = param_bank * 8
+        visible = params[param_start:param_start + 8]
+
+        # Knob geometry for the whole bank in one vector op (tiles are
+        # drawn at x=0, so every knob centre is the strip centre)
+        values = np.array([p.get("value", 0.0) for p in visible], dtype=float)
+        dot_xs, dot_ys, end_angles = compute_knob_geometry(
+            values, np.full(len(visible), STRIP_W // 2), KNOB_CY, KNOB_R,
+        )
 
         for i in range(8):
             x = i * STRIP_W
-            param_idx = param_start + i
-            if param_idx < len(params):
-                param = params[param_idx]
-                self._draw_param_knob(draw, x, param)
+            if i < len(visible):
+                geometry = (int(dot_xs[i]), int(dot_ys[i]), int(end_angles[i]))
+                img.paste(self._knob_tile(visible[i], geometry),
+                          (x, KNOB_TILE_TOP))
             else:
-                self._draw_empty_knob(draw, x)
-            # Separator
-            draw.line([x + STRIP_W - 1, 24, x + STRIP_W - 1, HEIGHT],
-                      fill=SEPARATOR)
+                self._draw_empty_knob(img, x)
 
         # Bank indicator at bottom
         total_params = len(params) if params else 0
         total_banks = max(1, (total_params + 7) // 8)
-        draw.text(
-            (WIDTH // 2, HEIGHT - 6),
+        draw_text(
+            img, (WIDTH // 2, HEIGHT - 6),
             f"Bank {param_bank + 1}/{total_banks}",
             fill=TEXT_DIM, font=self._font_tiny, anchor="mm",
         )
 
+        self._last_key = key
+        self._last_img = img
         return img
 
+    def _knob_tile(self, param: dict,
+                   geometry: tuple[int, int, int]) -> Image.Image:
+        """Return the rendered knob strip for a parameter, from the LRU cache.
+
+        geometry is (dot_x, dot_y, end_angle) from compute_knob_geometry.
+        """
+        key = (param.get("name", "?"), param.get("value", 0.0))
+        tile = self._knob_tiles.get(key)
+        if tile is not None:
+            self._knob_tiles.move_to_end(key)
+            return tile
+
+        strip = Image.new("RGB", (STRIP_W - 1, HEIGHT), BG)
+        self._draw_param_knob(ImageDraw.Draw(strip), 0, param, geometry)
+        tile = strip.crop((0, KNOB_TILE_TOP, STRIP_W - 1, KNOB_TILE_BOTTOM))
+        self._knob_tiles[key] = tile
+        if len(self._knob_tiles) > KNOB_TILE_CACHE_SIZE:
+            self._knob_tiles.popitem(last=False)
+        return tile
+
     def _draw_param_knob(self, draw: ImageDraw.ImageDraw, x: int,
-                         param: dict) -> None:
-        """Draw a parameter knob with name and value."""
+                         param: dict, geometry: tuple[int, int, int]) -> None:
+        """Draw a parameter knob with name and value.
+
+        geometry is (dot_x, dot_y, end_angle), relative to a strip at x=0.
+        """
         cx = x + STRIP_W // 2
 
         # Param name
@@ -127,8 +234,10 @@ class DeviceScreen:
 
         # Knob (arc indicator)
         knob_cx = cx
-        knob_cy = 78
-        knob_r = 22
+        knob_cy = KNOB_CY
+        knob_r = KNOB_R
+        dot_x, dot_y, end_angle = geometry
+        dot_x += x
 
         # Background arc
         draw.arc(
@@ -140,7 +249,6 @@ class DeviceScreen:
         # Value arc
         value = param.get("value", 0.0)
         if value > 0.0:
-            end_angle = 135 + int(value * 270)
             draw.arc(
                 [knob_cx - knob_r, knob_cy - knob_r,
                  knob_cx + knob_r, knob_cy + knob_r],
@@ -148,9 +256,6 @@ class DeviceScreen:
             )
 
         # Value indicator dot
-        angle_rad = math.radians(135 + value * 270)
-        dot_x = knob_cx + int((knob_r - 2) * math.cos(angle_rad))
-        dot_y = knob_cy + int((knob_r - 2) * math.sin(angle_rad))
         draw.ellipse([dot_x - 3, dot_y - 3, dot_x + 3, dot_y + 3],
                      fill=KNOB_COLOR)
 
@@ -161,6 +266,6 @@ class DeviceScreen:
             fill=TEXT_DIM, font=self._font_tiny, anchor="mm",
         )
 
-    def _draw_empty_knob(self, draw: ImageDraw.ImageDraw, x: int) -> None:
+    def _draw_empty_knob(self, img: Image.Image, x: int) -> None:
         cx = x + STRIP_W // 2
-        draw.text((cx, 78), "—", fill=TEXT_DIM, font=self._font_small, anchor="mm")
+        draw_text(img, (cx, KNOB_CY), "—", fill=TEXT_DIM, font=self._font_small, anchor="mm")
@@ -3,9 +3,16 @@
 Shows the selected drum pad, bank position, and step sequencer info.
 """
 
+import functools
 import logging
+from collections import OrderedDict
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from ui.fonts import FONT_BOLD, FONT_REGULAR, draw_text, get_font
+from ui.widgets import TileGrid
+
 log = logging.getLogger("push2reaper.ui.drum_screen")
 
 WIDTH = 960
@@ -18,6 +25,47 @@ ACCENT = (255, 120, 0)
 PAD_ACTIVE = (100, 200, 100)
 PAD_SELECTED = (255, 200, 50)
 SEPARATOR = (50, 50, 50)
+PAD_IDLE = (60, 60, 60)
+STEP_OFF = (40, 40, 40)
+STEP_OUTLINE = (80, 80, 80)
+
+# 4x4 pad grid overview
+PAD_GRID_X = 30
+PAD_GRID_Y = 35
+PAD_SIZE = 25
+PAD_GAP = 3
+PAD_PITCH = PAD_SIZE + PAD_GAP
+_PAD_GRID = TileGrid(
+    3 * PAD_PITCH + PAD_SIZE + 1, 3 * PAD_PITCH + PAD_SIZE + 1,
+    [[col * PAD_PITCH, row * PAD_PITCH,
+      col * PAD_PITCH + PAD_SIZE, row * PAD_PITCH + PAD_SIZE]
+     for row in range(4) for col in range(4)],
+)
+
+# 16-step grid, two rows of 8
+STEP_X = 500
+STEP_Y = 80
+STEP_SIZE = 26
+STEP_GAP = 2
+STEP_PITCH = STEP_SIZE + STEP_GAP
+_STEP_GRID = TileGrid(
+    7 * STEP_PITCH + STEP_SIZE + 1, STEP_PITCH + STEP_SIZE + 1,
+    [[(i % 8) * STEP_PITCH, (i // 8) * STEP_PITCH,
+      (i % 8) * STEP_PITCH + STEP_SIZE, (i // 8) * STEP_PITCH + STEP_SIZE]
+     for i in range(16)],
+)
+# Step fill color indexed by step on/off, and the shared step outline
+_STEP_PALETTE = np.array([STEP_OFF, PAD_ACTIVE], dtype=np.uint8)
+_STEP_OUTLINES = np.full((16, 3), STEP_OUTLINE, dtype=np.uint8)
+
+# Pad name list, right of the pad grid
+LIST_X = 180
+LIST_W = 100
+
+# Box holding the pad grid and name list, which only change with the bank
+# or selection; starts at the header bar's last row, where list text can reach
+PAD_PANEL_BOX = (PAD_GRID_X, 24, LIST_X + LIST_W, HEIGHT)
+PAD_PANEL_CACHE_SIZE = 32
 
 # GM drum note names (notes 36-51)
 GM_DRUM_NAMES = [
@@ -26,6 +74,17 @@ GM_DRUM_NAMES = [
     "Hi-Hat Ped", "Mid Tom", "Hi-Hat Op", "Mid Tom 2",
     "High Tom", "Crash", "High Tom 2", "Ride",
 ]
+NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F",
+              "F#", "G", "G#", "A", "A#", "B"]
+
+
+@functools.lru_cache(maxsize=128)
+def _note_name(note: int) -> str:
+    """Get a human-readable name for a MIDI note in drum context."""
+    if 36 <= note <= 51:
+        return GM_DRUM_NAMES[note - 36]
+    octave = (note // 12) - 1
+    return f"{NOTE_NAMES[note % 12]}{octave}"
 
 
 class DrumScreen:
@@ -36,22 +95,24 @@ class DrumScreen:
         self._font_small: ImageFont.FreeTypeFont | None = None
         self._font_tiny: ImageFont.FreeTypeFont | None = None
         self._load_fonts()
+        self._base_img = self._build_base()
+        # Persistent frame buffer: reset from the base image each render
+        self._img = self._base_img.copy()
+        # (bank_offset, selected_pad) → rendered pad panel, most recent last
+        self._pad_panels: OrderedDict[tuple[int, int], Image.Image] = OrderedDict()
+
+    def _build_base(self) -> Image.Image:
+        """Pre-render the frame-invariant parts: header bar and title."""
+        img = Image.new("RGB", (WIDTH, HEIGHT), BG)
+        draw = ImageDraw.Draw(img)
+        draw.rectangle([0, 0, WIDTH, 24], fill=(30, 30, 30))
+        draw.text((10, 12), "DRUM MODE", fill=ACCENT, font=self._font, anchor="lm")
+        return img
 
     def _load_fonts(self) -> None:
-        try:
-            self._font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14
-            )
-            self._font_small = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11
-            )
-            self._font_tiny = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 9
-            )
-        except OSError:
-            self._font = ImageFont.load_default()
-            self._font_small = self._font
-            self._font_tiny = self._font
+        self._font = get_font(FONT_BOLD, 14)
+        self._font_small = get_font(FONT_REGULAR, 11)
+        self._font_tiny = get_font(FONT_REGULAR, 9)
 
     def render(self, selected_pad: int, bank_offset: int,
                step_grid: list[bool] | None = None) -> Image.Image:
@@ -61,98 +122,92 @@ class DrumScreen:
             selected_pad: Currently selected drum pad index (0-15 within bank)
             bank_offset: Base MIDI note for current bank (e.g. 36)
             step_grid: Optional 16-step pattern for selected pad
+
+        The returned image is a persistent buffer, overwritten by the next
+        render.
         """
-        img = Image.new("RGB", (WIDTH, HEIGHT), BG)
-        draw = ImageDraw.Draw(img)
+        img = self._img
+        img.paste(self._base_img)
 
         note = bank_offset + selected_pad
-        pad_name = self._note_name(note)
+        pad_name = _note_name(note)
 
-        # Header
-        draw.rectangle([0, 0, WIDTH, 24], fill=(30, 30, 30))
-        draw.text(
-            (10, 12), f"DRUM MODE",
-            fill=ACCENT, font=self._font, anchor="lm",
-        )
-        draw.text(
-            (200, 12), f"Pad: {pad_name} (Note {note})",
+        # Header (bar and title are part of the base image)
+        draw_text(
+            img, (200, 12), f"Pad: {pad_name} (Note {note})",
             fill=TEXT, font=self._font, anchor="lm",
         )
-        draw.text(
-            (WIDTH - 10, 12), f"Bank: {bank_offset}-{bank_offset + 15}",
+        draw_text(
+            img, (WIDTH - 10, 12), f"Bank: {bank_offset}-{bank_offset + 15}",
             fill=TEXT_DIM, font=self._font_small, anchor="rm",
         )
 
-        # Draw 4x4 pad grid overview
-        grid_x = 30
-        grid_y = 35
-        pad_size = 25
-        pad_gap = 3
+        # 4x4 pad grid overview and pad name list
+        img.paste(self._pad_panel(bank_offset, selected_pad), PAD_PANEL_BOX[:2])
+
+        # Step grid (if available) — 16 steps across the right portion
+        if step_grid is not None:
+            draw_text(
+                img, (STEP_X, STEP_Y - 12), "Steps:",
+                fill=TEXT_DIM, font=self._font_small, anchor="lm",
+            )
+
+            active = np.fromiter((bool(step) for step in step_grid[:16]),
+                                 dtype=np.intp, count=16)
+            img.paste(
+                _STEP_GRID.render(_STEP_PALETTE[active], _STEP_OUTLINES, BG),
+                (STEP_X, STEP_Y),
+            )
+
+        return img
+
+    def _pad_panel(self, bank_offset: int, selected_pad: int) -> Image.Image:
+        """Return the rendered pad grid and name list, from the LRU cache."""
+        key = (bank_offset, selected_pad)
+        panel = self._pad_panels.get(key)
+        if panel is not None:
+            self._pad_panels.move_to_end(key)
+            return panel
+
+        img = self._base_img.copy()
+
+        # Draw 4x4 pad grid overview (all 16 pads in one array write)
+        grid_x = PAD_GRID_X
+        grid_y = PAD_GRID_Y
+        pad_size = PAD_SIZE
+
+        pad_fills = np.full((16, 3), PAD_IDLE, dtype=np.uint8)
+        if 0 <= selected_pad < 16:
+            pad_fills[selected_pad] = PAD_SELECTED
+        img.paste(_PAD_GRID.render(pad_fills, bg=BG), (grid_x, grid_y))
 
         for row in range(4):
             for col in range(4):
                 pad_idx = row * 4 + col
-                px = grid_x + col * (pad_size + pad_gap)
-                py = grid_y + row * (pad_size + pad_gap)
-
-                if pad_idx == selected_pad:
-                    color = PAD_SELECTED
-                else:
-                    color = (60, 60, 60)
-
-                draw.rectangle([px, py, px + pad_size, py + pad_size], fill=color)
+                px = grid_x + col * PAD_PITCH
+                py = grid_y + row * PAD_PITCH
 
                 n = bank_offset + pad_idx
-                draw.text(
-                    (px + pad_size // 2, py + pad_size // 2),
+                draw_text(
+                    img, (px + pad_size // 2, py + pad_size // 2),
                     str(n), fill=(0, 0, 0) if pad_idx == selected_pad else TEXT_DIM,
                     font=self._font_tiny, anchor="mm",
                 )
 
         # Pad name list (right side)
-        list_x = 180
+        list_x = LIST_X
         for i in range(16):
             n = bank_offset + i
-            name = self._note_name(n)
+            name = _note_name(n)
             y = 30 + i * 8
             if y > HEIGHT - 10:
                 break
             color = PAD_SELECTED if i == selected_pad else TEXT_DIM
-            draw.text((list_x, y), f"{n}: {name}", fill=color,
+            draw_text(img, (list_x, y), f"{n}: {name}", fill=color,
                       font=self._font_tiny, anchor="lm")
 
-        # Step grid (if available) — 16 steps across the right portion
-        if step_grid is not None:
-            step_y = 80
-            step_x_start = 500
-            step_size = 26
-            step_gap = 2
-
-            draw.text(
-                (step_x_start, step_y - 12), "Steps:",
-                fill=TEXT_DIM, font=self._font_small, anchor="lm",
-            )
-
-            for i in range(16):
-                sx = step_x_start + (i % 8) * (step_size + step_gap)
-                sy = step_y + (i // 8) * (step_size + step_gap)
-
-                if step_grid[i]:
-                    color = PAD_ACTIVE
-                else:
-                    color = (40, 40, 40)
-
-                draw.rectangle([sx, sy, sx + step_size, sy + step_size],
-                               fill=color, outline=(80, 80, 80))
-
-        return img
-
-    @staticmethod
-    def _note_name(note: int) -> str:
-        """Get a human-readable name for a MIDI note in drum context."""
-        if 36 <= note <= 51:
-            return GM_DRUM_NAMES[note - 36]
-        note_names = ["C", "C#", "D", "D#", "E", "F",
-                       "F#", "G", "G#", "A", "A#", "B"]
-        octave = (note // 12) - 1
-        return f"{note_names[note % 12]}{octave}"
+        panel = img.crop(PAD_PANEL_BOX)
+        self._pad_panels[key] = panel
+        if len(self._pad_panels) > PAD_PANEL_CACHE_SIZE:
+            self._pad_panels.popitem(last=False)
+        return panel
@@ -0,0 +1,56 @@
+"""Shared font loading and text drawing for the display screens.
+
+TrueType fonts are parsed once per (path, size) and the same
+FreeTypeFont object is handed to every screen that asks for it
+(get_font() lives in core.fonts, shared with push2.display).
+draw_text() caches rendered strings so repeated labels cost a paste.
+"""
+
+import functools
+
+from PIL import Image, ImageDraw, ImageFont
+
+# Re-exported: the screens import their fonts from here
+from core.fonts import FONT_BOLD, FONT_REGULAR, get_font
+
+
+@functools.lru_cache(maxsize=1024)
+def _text_mask(text: str, font: ImageFont.FreeTypeFont,
+               anchor: str) -> tuple[Image.Image, int, int] | None:
+    """Rasterize text once into an "L" mask plus its offset from the anchor."""
+    x0, y0, x1, y1 = font.getbbox(text, anchor=anchor)
+    if x1 <= x0 or y1 <= y0:
+        return None
+    mask = Image.new("L", (x1 - x0, y1 - y0), 0)
+    ImageDraw.Draw(mask).text((-x0, -y0), text, fill=255, font=font, anchor=anchor)
+    return mask, x0, y0
+
+
+def text_mask(text: str, font: ImageFont.FreeTypeFont,
+              anchor: str = "la") -> tuple[Image.Image, int, int] | None:
+    """Rendered mask for a fixed label, to hold on to and pass to paste_mask().
+
+    Lets a screen resolve its constant indicator strings once instead of
+    looking them up in the draw_text() cache on every draw.
+    """
+    return _text_mask(text, font, anchor)
+
+
+def paste_mask(img: Image.Image, xy: tuple[int, int],
+               entry: tuple[Image.Image, int, int] | None, fill: tuple) -> None:
+    """Paste a text_mask() entry in fill color, anchored at xy."""
+    if entry is not None:
+        mask, dx, dy = entry
+        img.paste(fill, (xy[0] + dx, xy[1] + dy), mask)
+
+
+def draw_text(img: Image.Image, xy: tuple[int, int], text: str, *,
+              fill: tuple, font: ImageFont.FreeTypeFont,
+              anchor: str = "la") -> None:
+    """Drop-in for ImageDraw.text() that pastes a cached text mask.
+
+    Each (text, font, anchor) is laid out and rasterized once; later calls
+    are a single paste, pixel-identical to draw.text(). The cache is LRU
+    bounded, so dynamic strings (dB values, beat positions) are fine.
+    """
+    paste_mask(img, xy, _text_mask(text, font, anchor), fill)
@@ -5,6 +5,7 @@ from PIL import Image, ImageDraw, ImageFont
 
 from push2.scales import (ScaleState, SCALE_LIST, LAYOUT_LIST,
                            ROOT_NAMES, SCALE_PAGES, TOTAL_PAGES)
+from ui.fonts import FONT_BOLD, FONT_REGULAR, draw_text, get_font
 
 log = logging.getLogger("push2reaper.ui.scale_screen")
 
@@ -29,44 +30,63 @@ class ScaleScreen:
         self._font_small: ImageFont.FreeTypeFont | None = None
         self._font_tiny: ImageFont.FreeTypeFont | None = None
         self._load_fonts()
+        self._base_img = self._build_base()
+        # Persistent frame buffer: reset from the base image each render
+        self._img = self._base_img.copy()
+        self._draw = ImageDraw.Draw(self._img)
+        # Label widths for centering; the label sets and fonts are fixed
+        self._root_widths = [self._text_width(self._font_small, n) for n in ROOT_NAMES]
+        self._scale_widths = [self._text_width(self._font_small, n) for n in SCALE_LIST]
+        self._layout_widths = [self._text_width(self._font_small, n) for n in LAYOUT_LIST]
+        self._in_key_width = self._text_width(self._font_small, "In Key")
+        self._on_off_widths = {
+            t: self._text_width(self._font_tiny, t) for t in ("ON", "OFF")
+        }
+
+    def _build_base(self) -> Image.Image:
+        """Pre-render the frame-invariant header bar."""
+        img = Image.new("RGB", (WIDTH, HEIGHT), BG)
+        ImageDraw.Draw(img).rectangle([0, 0, WIDTH, 30], fill=HEADER_BG)
+        return img
+
+    @staticmethod
+    def _text_width(font: ImageFont.FreeTypeFont, text: str) -> int:
+        """Ink width of text, as ImageDraw.textbbox() measures it."""
+        bbox = font.getbbox(text)
+        return bbox[2] - bbox[0]
 
     def _load_fonts(self) -> None:
-        try:
-            self._font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 16
-            )
-            self._font_small = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 13
-            )
-            self._font_tiny = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 10
-            )
-        except OSError:
-            self._font = ImageFont.load_default()
-            self._font_small = self._font
-            self._font_tiny = self._font
+        self._font = get_font(FONT_BOLD, 16)
+        self._font_small = get_font(FONT_REGULAR, 13)
+        self._font_tiny = get_font(FONT_REGULAR, 10)
 
     def render(self, scale_state: ScaleState) -> Image.Image:
-        img = Image.new("RGB", (WIDTH, HEIGHT), BG)
-        draw = ImageDraw.Draw(img)
+        """Render the scale screen.
+
+        The returned image is a persistent buffer, overwritten by the next
+        render.
+        """
+        img = self._img
+        draw = self._draw
+        img.paste(self._base_img)
 
-        self._draw_header(draw, scale_state)
-        self._draw_root_row(draw, scale_state)
+        self._draw_header(img, draw, scale_state)
+        self._draw_root_row(img, draw, scale_state)
 
         if scale_state.is_settings_page:
-            self._draw_settings_row(draw, scale_state)
+            self._draw_settings_row(img, draw, scale_state)
         else:
-            self._draw_scale_row(draw, scale_state)
+            self._draw_scale_row(img, draw, scale_state)
 
         return img
 
-    def _draw_header(self, draw: ImageDraw.Draw, s: ScaleState) -> None:
-        """Top banner with current selection."""
-        draw.rectangle([0, 0, WIDTH, 30], fill=HEADER_BG)
+    def _draw_header(self, img: Image.Image, draw: ImageDraw.Draw,
+                     s: ScaleState) -> None:
+        """Top banner with current selection (bar is part of the base image)."""
         in_key_str = "In Key" if s.in_key else "Chromatic"
         text = (f"Scale: {s.scale_name}    Root: {s.root_name}    "
                 f"Layout: {s.layout_name}    {in_key_str}    Oct: {s.octave_offset:+d}")
-        draw.text((10, 6), text, fill=TEXT, font=self._font)
+        draw_text(img, (10, 6), text, fill=TEXT, font=self._font)
 
         # Page indicator
         if s.is_settings_page:
@@ -74,9 +94,10 @@ class ScaleScreen:
         else:
             page_label = f"Scales {s.page + 1}/{SCALE_PAGES}"
         page_text = f"{page_label}  [{s.page + 1}/{TOTAL_PAGES}]"
-        draw.text((WIDTH - 170, 8), page_text, fill=TEXT_DIM, font=self._font_small)
+        draw_text(img, (WIDTH - 170, 8), page_text, fill=TEXT_DIM, font=self._font_small)
 
-    def _draw_root_row(self, draw: ImageDraw.Draw, s: ScaleState) -> None:
+    def _draw_root_row(self, img: Image.Image, draw: ImageDraw.Draw,
+                       s: ScaleState) -> None:
         """Upper row: root note selection (8 slots)."""
         y_top = 35
         y_bot = 80
@@ -94,12 +115,11 @@ class ScaleScreen:
                                fill=ROOT_SELECTED_BG)
 
             color = TEXT if is_selected else TEXT_DIM
-            bbox = draw.textbbox((0, 0), name, font=self._font_small)
-            tw = bbox[2] - bbox[0]
-            tx = x + (COL_W - tw) // 2
-            draw.text((tx, y_top + 10), name, fill=color, font=self._font_small)
+            tx = x + (COL_W - self._root_widths[i]) // 2
+            draw_text(img, (tx, y_top + 10), name, fill=color, font=self._font_small)
 
-    def _draw_scale_row(self, draw: ImageDraw.Draw, s: ScaleState) -> None:
+    def _draw_scale_row(self, img: Image.Image, draw: ImageDraw.Draw,
+                        s: ScaleState) -> None:
         """Lower row: scale type selection (8 per page)."""
         y_top = 90
         y_bot = 155
@@ -120,12 +140,11 @@ class ScaleScreen:
                                fill=SCALE_SELECTED_BG)
 
             color = TEXT if is_selected else TEXT_DIM
-            bbox = draw.textbbox((0, 0), name, font=self._font_small)
-            tw = bbox[2] - bbox[0]
-            tx = x + (COL_W - tw) // 2
-            draw.text((tx, y_top + 18), name, fill=color, font=self._font_small)
+            tx = x + (COL_W - self._scale_widths[scale_idx]) // 2
+            draw_text(img, (tx, y_top + 18), name, fill=color, font=self._font_small)
 
-    def _draw_settings_row(self, draw: ImageDraw.Draw, s: ScaleState) -> None:
+    def _draw_settings_row(self, img: Image.Image, draw: ImageDraw.Draw,
+                           s: ScaleState) -> None:
         """Lower row: settings page (layouts + In Key toggle)."""
         y_top = 90
         y_bot = 155
@@ -140,24 +159,17 @@ class ScaleScreen:
                                fill=LAYOUT_SELECTED_BG)
 
             color = TEXT if is_selected else TEXT_DIM
-            bbox = draw.textbbox((0, 0), name, font=self._font_small)
-            tw = bbox[2] - bbox[0]
-            tx = x + (COL_W - tw) // 2
-            draw.text((tx, y_top + 18), name, fill=color, font=self._font_small)
+            tx = x + (COL_W - self._layout_widths[i]) // 2
+            draw_text(img, (tx, y_top + 18), name, fill=color, font=self._font_small)
 
         # In Key toggle on last button (index 7)
         x = 7 * COL_W
         in_key_bg = (20, 80, 20) if s.in_key else (40, 40, 40)
         draw.rectangle([x + 2, y_top, x + COL_W - 2, y_bot], fill=in_key_bg)
 
-        label = "In Key"
-        bbox = draw.textbbox((0, 0), label, font=self._font_small)
-        tw = bbox[2] - bbox[0]
-        tx = x + (COL_W - tw) // 2
-        draw.text((tx, y_top + 12), label, fill=TEXT, font=self._font_small)
+        tx = x + (COL_W - self._in_key_width) // 2
+        draw_text(img, (tx, y_top + 12), "In Key", fill=TEXT, font=self._font_small)
 
         state_text = "ON" if s.in_key else "OFF"
-        bbox2 = draw.textbbox((0, 0), state_text, font=self._font_tiny)
-        tw2 = bbox2[2] - bbox2[0]
-        tx2 = x + (COL_W - tw2) // 2
-        draw.text((tx2, y_top + 32), state_text, fill=TEXT_DIM, font=self._font_tiny)
+        tx2 = x + (COL_W - self._on_off_widths[state_text]) // 2
+        draw_text(img, (tx2, y_top + 32), state_text, fill=TEXT_DIM, font=self._font_tiny)
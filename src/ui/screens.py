@@ -4,9 +4,13 @@ Each screen renders a PIL Image (960x160) for the Push 2 display.
 """
 
 import logging
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from reaper.state import ReaperState, TrackInfo
+from ui.fonts import (FONT_BOLD, FONT_REGULAR, draw_text, get_font,
+                      paste_mask, text_mask)
 
 log = logging.getLogger("push2reaper.ui.screens")
 
@@ -28,6 +32,23 @@ SELECT_COLOR = (255, 140, 30)
 PAN_COLOR = (100, 180, 255)
 SEPARATOR = (50, 50, 50)
 
+# Fader geometry (shared by every channel strip)
+FADER_TOP = 26
+FADER_BOTTOM = 120
+FADER_H = FADER_BOTTOM - FADER_TOP
+FADER_X = 8  # offset from the strip's left edge
+FADER_W = 30
+VU_W = 6
+PAN_X = 60
+PAN_Y = 35
+PAN_W = 50
+INDICATOR_Y = 60
+IND_SIZE = 14
+TRANSPORT_Y = HEIGHT - 18
+TRANSPORT_BG = (20, 20, 20)
+# VU level from which the meter is drawn red
+VU_HOT = 0.8
+
 TRACK_COLORS = [
     (255, 60, 60),    # red
     (255, 140, 30),   # orange
@@ -38,6 +59,42 @@ TRACK_COLORS = [
     (160, 80, 220),   # purple
     (240, 100, 180),  # pink
 ]
+# Half-brightness TRACK_COLORS, for unselected strip headers
+TRACK_COLORS_DIM = [tuple(c // 2 for c in color) for color in TRACK_COLORS]
+
+
+def _fill_rect(fb: np.ndarray, x0: int, y0: int, x1: int, y1: int,
+               fill: tuple | None, outline: tuple | None = None) -> None:
+    """NumPy equivalent of draw.rectangle([x0, y0, x1, y1], fill, outline).
+
+    Coordinates are inclusive, as with ImageDraw; the box is clipped to fb.
+    """
+    x0, y0 = max(x0, 0), max(y0, 0)
+    if fill is not None:
+        fb[y0:y1 + 1, x0:x1 + 1] = fill
+    if outline is not None:
+        fb[y0, x0:x1 + 1] = outline
+        fb[y1, x0:x1 + 1] = outline
+        fb[y0:y1 + 1, x0] = outline
+        fb[y0:y1 + 1, x1] = outline
+
+
+def _build_strip_base() -> np.ndarray:
+    """Pre-fill the track-independent parts of one channel strip.
+
+    Fader background and border, pan line, mute/solo box outlines and the
+    separator, above the transport bar.
+    """
+    fb = np.empty((TRANSPORT_Y, STRIP_W, 3), dtype=np.uint8)
+    fb[:] = BG
+    _fill_rect(fb, FADER_X, FADER_TOP, FADER_X + FADER_W, FADER_BOTTOM,
+               FADER_BG, outline=FADER_BORDER)
+    _fill_rect(fb, PAN_X, PAN_Y, PAN_X + PAN_W, PAN_Y + 2, FADER_BG)
+    for box_x in (PAN_X, PAN_X + IND_SIZE + 4):
+        _fill_rect(fb, box_x, INDICATOR_Y, box_x + IND_SIZE,
+                   INDICATOR_Y + IND_SIZE, None, outline=FADER_BORDER)
+    fb[:, STRIP_W - 1] = SEPARATOR
+    return fb
 
 
 class MixerScreen:
@@ -48,163 +105,194 @@ class MixerScreen:
         self._font_small: ImageFont.FreeTypeFont | None = None
         self._font_tiny: ImageFont.FreeTypeFont | None = None
         self._load_fonts()
+        # Masks for the fixed indicator labels, resolved once
+        self._mute_label = text_mask("M", self._font_tiny, "mm")
+        self._solo_label = text_mask("S", self._font_tiny, "mm")
+        self._status_labels = {
+            status: text_mask(status, self._font_small, "lm")
+            for status in ("REC", "PLAY", "PAUSE", "STOP")
+        }
+        self._loop_label = text_mask("LOOP", self._font_small, "lm")
+        # Persistent frame; strips and the transport bar are redrawn in
+        # place only when their content key changes
+        self._img = Image.new("RGB", (WIDTH, HEIGHT), BG)
+        self._draw = ImageDraw.Draw(self._img)
+        self._strip_keys: list[tuple | None] = [None] * 8
+        self._transport_key: tuple | None = None
+        # Buffer for one strip's solid fills (above the transport bar),
+        # reset from the static strip base before each strip
+        self._strip_base = _build_strip_base()
+        self._strip_fb = np.empty_like(self._strip_base)
 
     def _load_fonts(self) -> None:
-        try:
-            self._font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14
-            )
-            self._font_small = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11
-            )
-            self._font_tiny = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 9
-            )
-        except OSError:
-            self._font = ImageFont.load_default()
-            self._font_small = self._font
-            self._font_tiny = self._font
+        self._font = get_font(FONT_BOLD, 14)
+        self._font_small = get_font(FONT_REGULAR, 11)
+        self._font_tiny = get_font(FONT_REGULAR, 9)
 
     def render(self, state: ReaperState) -> Image.Image:
-        """Render the mixer screen."""
-        img = Image.new("RGB", (WIDTH, HEIGHT), BG)
-        draw = ImageDraw.Draw(img)
+        """Render the mixer screen.
+
+        Only strips (and the transport bar) whose visible content changed
+        since the previous frame are redrawn; the rest of the persistent
+        frame is left as is. The returned image is that persistent buffer,
+        overwritten by the next render.
+
+        Solid rectangles and lines go into a reused NumPy strip buffer;
+        text and ellipses are drawn with PIL on top.
+        """
+        img = self._img
+        draw = self._draw
+        fb = self._strip_fb
 
         tracks = state.get_bank_tracks()
 
+        # Fader/VU fill heights and pan dot offsets for all 8 strips in
+        # one vector op each. Numeric fields come only from the snapshot
+        # arrays, never the live TrackInfo views, so a strip can't mix
+        # values from before and after an OSC update
+        levels = state.get_bank_levels()
+        fill_heights = (levels["volume"] * FADER_H).astype(int).tolist()
+        vu_heights = (levels["vu"] * FADER_H).astype(int).tolist()
+        vu_hot = (levels["vu"] >= VU_HOT).tolist()
+        pan_offsets = (levels["pan"] * PAN_W).astype(int).tolist()
+        mutes = levels["mute"].tolist()
+        solos = levels["solo"].tolist()
+        rec_arms = levels["rec_arm"].tolist()
+
         for i, track in enumerate(tracks):
+            if track.color:
+                color, color_dim = track.color, track.color_dim
+            else:
+                color = TRACK_COLORS[i % len(TRACK_COLORS)]
+                color_dim = TRACK_COLORS_DIM[i % len(TRACK_COLORS)]
+            is_selected = track.index == state.selected_track
+            # Everything the strip draws, so equal keys mean equal pixels
+            mute, solo, rec_arm = mutes[i], solos[i], rec_arms[i]
+            key = (
+                track.display_name, track.volume_str[:7], track.pan_str[:5],
+                color, is_selected, mute, solo, rec_arm,
+                vu_hot[i], fill_heights[i], vu_heights[i], pan_offsets[i],
+            )
+            if key == self._strip_keys[i]:
+                continue
+            self._strip_keys[i] = key
+
             x = i * STRIP_W
-            color = track.color if track.color else TRACK_COLORS[i % len(TRACK_COLORS)]
-            self._draw_channel_strip(draw, x, track, color, state)
+            fb[:] = self._strip_base
+            self._fill_channel_strip(fb, 0, color,
+                                     color if is_selected else color_dim,
+                                     fill_heights[i], vu_heights[i],
+                                     vu_hot[i], mute, solo)
+            img.paste(Image.frombuffer("RGB", (STRIP_W, TRANSPORT_Y), fb,
+                                       "raw", "RGB", 0, 1), (x, 0))
+            self._draw_channel_strip(img, draw, x, track, is_selected,
+                                     pan_offsets[i], mute, solo, rec_arm)
 
         # Draw transport bar at bottom
-        self._draw_transport_bar(draw, state)
+        transport_key = (
+            state.recording, state.playing, state.paused, state.beat_str,
+            f"{state.tempo:.1f}", state.repeat, state.bank_offset,
+        )
+        if transport_key != self._transport_key:
+            self._transport_key = transport_key
+            self._draw_transport_bar(img, state)
 
         return img
 
+    def _fill_channel_strip(
+        self, fb: np.ndarray, x: int, color: tuple, header_color: tuple,
+        fill_h: int, vu_h: int, vu_hot: bool, mute: bool, solo: bool,
+    ) -> None:
+        """Fill the track-dependent solid parts of a channel strip into fb.
+
+        fb must already hold the strip base (see _build_strip_base).
+        header_color is the track color, dimmed unless the track is selected;
+        fill_h / vu_h are the precomputed fader and VU fill heights in pixels,
+        and vu_hot / mute / solo the track's flags from the bank snapshot.
+        """
+        # --- Header (top 22px) ---
+        _fill_rect(fb, x, 0, x + STRIP_W - 2, 20, header_color)
+
+        # --- Volume fader fill (background and border are in the base) ---
+        fader_x = x + FADER_X
+        if fill_h > 0:
+            fill_color = color if not mute else (80, 80, 80)
+            _fill_rect(fb, fader_x + 1, FADER_BOTTOM - fill_h,
+                       fader_x + FADER_W - 1, FADER_BOTTOM - 1, fill_color)
+
+        # --- VU meter (thin bar next to fader) ---
+        vu_x = fader_x + FADER_W + 4
+        if vu_h > 0:
+            vu_color = (255, 60, 60) if vu_hot else (50, 200, 50)
+            _fill_rect(fb, vu_x, FADER_BOTTOM - vu_h, vu_x + VU_W, FADER_BOTTOM,
+                       vu_color)
+
+        # --- Mute/Solo boxes: filled when active, otherwise the outline
+        # from the base shows (rec arm is an ellipse, drawn with PIL) ---
+        mute_x = x + PAN_X
+        solo_x = mute_x + IND_SIZE + 4
+        y = INDICATOR_Y
+        if mute:
+            _fill_rect(fb, mute_x, y, mute_x + IND_SIZE, y + IND_SIZE, MUTE_COLOR)
+        if solo:
+            _fill_rect(fb, solo_x, y, solo_x + IND_SIZE, y + IND_SIZE, SOLO_COLOR)
+
     def _draw_channel_strip(
-        self, draw: ImageDraw.ImageDraw, x: int, track: TrackInfo,
-        color: tuple, state: ReaperState
+        self, img: Image.Image, draw: ImageDraw.ImageDraw, x: int,
+        track: TrackInfo, is_selected: bool, pan_dx: int,
+        mute: bool, solo: bool, rec_arm: bool,
     ) -> None:
-        """Draw a single channel strip (120px wide)."""
-        cx = x + STRIP_W // 2  # center x
-        is_selected = track.index == state.selected_track
+        """Draw the text and round parts of a channel strip over the fills.
 
-        # --- Header: track name (top 22px) ---
-        header_color = color if is_selected else tuple(c // 2 for c in color)
-        draw.rectangle([x, 0, x + STRIP_W - 2, 20], fill=header_color)
+        pan_dx is the precomputed pan dot offset; mute / solo / rec_arm are
+        the track's flags from the bank snapshot.
+        """
+        cx = x + STRIP_W // 2  # center x
 
-        name = track.name[:10]  # truncate long names
-        draw.text(
-            (cx, 10), name,
+        # --- Header: track name ---
+        name = track.display_name  # truncated long name
+        draw_text(
+            img, (cx, 10), name,
             fill=(0, 0, 0) if is_selected else (200, 200, 200),
             font=self._font_small, anchor="mm",
         )
 
-        # --- Volume fader (main visual element) ---
-        fader_x = x + 8
-        fader_w = 30
-        fader_top = 26
-        fader_bottom = 120
-
-        # Fader background
-        draw.rectangle(
-            [fader_x, fader_top, fader_x + fader_w, fader_bottom],
-            fill=FADER_BG, outline=FADER_BORDER,
-        )
-
-        # Fader fill
-        fader_h = fader_bottom - fader_top
-        fill_h = int(track.volume * fader_h)
-        if fill_h > 0:
-            fill_color = color if not track.mute else (80, 80, 80)
-            draw.rectangle(
-                [fader_x + 1, fader_bottom - fill_h, fader_x + fader_w - 1, fader_bottom - 1],
-                fill=fill_color,
-            )
-
-        # Volume text
-        draw.text(
-            (fader_x + fader_w // 2, fader_bottom + 6),
+        # --- Volume text ---
+        fader_x = x + FADER_X
+        draw_text(
+            img, (fader_x + FADER_W // 2, FADER_BOTTOM + 6),
             track.volume_str[:7],
             fill=TEXT_DIM, font=self._font_tiny, anchor="mt",
         )
 
-        # --- VU meter (thin bar next to fader) ---
-        vu_x = fader_x + fader_w + 4
-        vu_w = 6
-        vu_h = int(track.vu * fader_h)
-        if vu_h > 0:
-            vu_color = (50, 200, 50) if track.vu < 0.8 else (255, 60, 60)
-            draw.rectangle(
-                [vu_x, fader_bottom - vu_h, vu_x + vu_w, fader_bottom],
-                fill=vu_color,
-            )
-
-        # --- Pan indicator ---
-        pan_x = x + 60
-        pan_y = 35
-        pan_w = 50
-        # Pan line
-        draw.rectangle([pan_x, pan_y, pan_x + pan_w, pan_y + 2], fill=FADER_BG)
-        # Pan position dot
-        dot_x = pan_x + int(track.pan * pan_w)
+        # --- Pan position dot and text ---
+        pan_x = x + PAN_X
+        pan_y = PAN_Y
+        dot_x = pan_x + pan_dx
         draw.ellipse([dot_x - 3, pan_y - 3, dot_x + 3, pan_y + 3], fill=PAN_COLOR)
-        # Pan text
-        draw.text(
-            (pan_x + pan_w // 2, pan_y + 10),
+        draw_text(
+            img, (pan_x + PAN_W // 2, pan_y + 10),
             track.pan_str[:5],
             fill=TEXT_DIM, font=self._font_tiny, anchor="mt",
         )
 
-        # --- Mute/Solo/Rec indicators ---
-        indicator_y = 60
-        ind_size = 14
-
-        # Mute
-        if track.mute:
-            draw.rectangle(
-                [pan_x, indicator_y, pan_x + ind_size, indicator_y + ind_size],
-                fill=MUTE_COLOR,
-            )
-            draw.text(
-                (pan_x + ind_size // 2, indicator_y + ind_size // 2),
-                "M", fill=(0, 0, 0), font=self._font_tiny, anchor="mm",
-            )
-        else:
-            draw.rectangle(
-                [pan_x, indicator_y, pan_x + ind_size, indicator_y + ind_size],
-                outline=FADER_BORDER,
-            )
-            draw.text(
-                (pan_x + ind_size // 2, indicator_y + ind_size // 2),
-                "M", fill=TEXT_DIM, font=self._font_tiny, anchor="mm",
-            )
+        # --- Mute/Solo labels, rec arm indicator ---
+        indicator_y = INDICATOR_Y
+        ind_size = IND_SIZE
+        mute_x = pan_x
+        paste_mask(
+            img, (mute_x + ind_size // 2, indicator_y + ind_size // 2),
+            self._mute_label, (0, 0, 0) if mute else TEXT_DIM,
+        )
 
-        # Solo
-        solo_x = pan_x + ind_size + 4
-        if track.solo:
-            draw.rectangle(
-                [solo_x, indicator_y, solo_x + ind_size, indicator_y + ind_size],
-                fill=SOLO_COLOR,
-            )
-            draw.text(
-                (solo_x + ind_size // 2, indicator_y + ind_size // 2),
-                "S", fill=(0, 0, 0), font=self._font_tiny, anchor="mm",
-            )
-        else:
-            draw.rectangle(
-                [solo_x, indicator_y, solo_x + ind_size, indicator_y + ind_size],
-                outline=FADER_BORDER,
-            )
-            draw.text(
-                (solo_x + ind_size // 2, indicator_y + ind_size // 2),
-                "S", fill=TEXT_DIM, font=self._font_tiny, anchor="mm",
-            )
+        solo_x = mute_x + ind_size + 4
+        paste_mask(
+            img, (solo_x + ind_size // 2, indicator_y + ind_size // 2),
+            self._solo_label, (0, 0, 0) if solo else TEXT_DIM,
+        )
 
-        # Rec arm
         rec_x = solo_x + ind_size + 4
-        if track.rec_arm:
+        if rec_arm:
             draw.ellipse(
                 [rec_x, indicator_y, rec_x + ind_size, indicator_y + ind_size],
                 fill=REC_COLOR,
@@ -215,15 +303,10 @@ class MixerScreen:
                 outline=FADER_BORDER,
             )
 
-        # --- Separator line ---
-        draw.line([x + STRIP_W - 1, 0, x + STRIP_W - 1, HEIGHT], fill=SEPARATOR)
-
-    def _draw_transport_bar(self, draw: ImageDraw.ImageDraw, state: ReaperState) -> None:
-        """Draw transport info bar at bottom."""
-        bar_y = HEIGHT - 18
-
-        # Background
-        draw.rectangle([0, bar_y, WIDTH, HEIGHT], fill=(20, 20, 20))
+    def _draw_transport_bar(self, img: Image.Image, state: ReaperState) -> None:
+        """Draw the transport bar at the bottom, over its own background."""
+        bar_y = TRANSPORT_Y
+        img.paste(TRANSPORT_BG, (0, bar_y, WIDTH, HEIGHT))
 
         # Transport state
         if state.recording:
@@ -239,32 +322,29 @@ class MixerScreen:
             status = "STOP"
             status_color = TEXT_DIM
 
-        draw.text((8, bar_y + 9), status, fill=status_color, font=self._font_small, anchor="lm")
+        paste_mask(img, (8, bar_y + 9), self._status_labels[status], status_color)
 
         # Beat position
-        draw.text(
-            (100, bar_y + 9), state.beat_str,
+        draw_text(
+            img, (100, bar_y + 9), state.beat_str,
             fill=TEXT, font=self._font_small, anchor="lm",
         )
 
         # Tempo
-        draw.text(
-            (250, bar_y + 9), f"{state.tempo:.1f} BPM",
+        draw_text(
+            img, (250, bar_y + 9), f"{state.tempo:.1f} BPM",
             fill=TEXT_DIM, font=self._font_small, anchor="lm",
         )
 
         # Repeat indicator
         if state.repeat:
-            draw.text(
-                (400, bar_y + 9), "LOOP",
-                fill=ACCENT, font=self._font_small, anchor="lm",
-            )
+            paste_mask(img, (400, bar_y + 9), self._loop_label, ACCENT)
 
         # Bank info
         bank_start = state.bank_offset + 1
         bank_end = state.bank_offset + 8
-        draw.text(
-            (WIDTH - 8, bar_y + 9),
+        draw_text(
+            img, (WIDTH - 8, bar_y + 9),
             f"Tracks {bank_start}-{bank_end}",
             fill=TEXT_DIM, font=self._font_small, anchor="rm",
         )
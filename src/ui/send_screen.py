@@ -5,9 +5,12 @@ send names and volume bars.
 """
 
 import logging
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
 from reaper.state import ReaperState
+from ui.fonts import FONT_BOLD, FONT_REGULAR, draw_text, get_font
 
 log = logging.getLogger("push2reaper.ui.send_screen")
 
@@ -24,6 +27,13 @@ SEPARATOR = (50, 50, 50)
 SEND_COLOR = (100, 180, 255)
 HEADER_COLOR = (60, 100, 200)
 
+FADER_TOP = 44
+FADER_BOTTOM = 130
+FADER_H = FADER_BOTTOM - FADER_TOP
+
+# x of the separator line at the right edge of each strip
+_SEPARATOR_XS = np.arange(8) * STRIP_W + STRIP_W - 1
+
 
 class SendScreen:
     """Renders send levels for the selected track."""
@@ -33,77 +43,85 @@ class SendScreen:
         self._font_small: ImageFont.FreeTypeFont | None = None
         self._font_tiny: ImageFont.FreeTypeFont | None = None
         self._load_fonts()
+        self._base_img = self._build_base()
+        # Persistent frame buffer: reset from the base image each render
+        self._img = self._base_img.copy()
+        self._draw = ImageDraw.Draw(self._img)
+
+    def _build_base(self) -> Image.Image:
+        """Pre-render the frame-invariant parts: header bar and separators."""
+        fb = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        fb[:] = BG
+        fb[:21] = (30, 30, 30)
+        # All 8 strip separators in one strided store
+        fb[20:, _SEPARATOR_XS] = SEPARATOR
+        return Image.fromarray(fb)
 
     def _load_fonts(self) -> None:
-        try:
-            self._font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14
-            )
-            self._font_small = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11
-            )
-            self._font_tiny = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 9
-            )
-        except OSError:
-            self._font = ImageFont.load_default()
-            self._font_small = self._font
-            self._font_tiny = self._font
+        self._font = get_font(FONT_BOLD, 14)
+        self._font_small = get_font(FONT_REGULAR, 11)
+        self._font_tiny = get_font(FONT_REGULAR, 9)
 
     def render(self, state: ReaperState) -> Image.Image:
-        img = Image.new("RGB", (WIDTH, HEIGHT), BG)
-        draw = ImageDraw.Draw(img)
+        """Render the send screen.
+
+        The returned image is a persistent buffer, overwritten by the next
+        render.
+        """
+        img = self._img
+        draw = self._draw
 
         track_num = state.selected_track
         track = state.tracks.get(track_num)
         if track is None:
+            img.paste(BG, (0, 0, WIDTH, HEIGHT))
             return img
 
-        # Header: track name
-        draw.rectangle([0, 0, WIDTH, 20], fill=(30, 30, 30))
-        draw.text(
-            (WIDTH // 2, 10),
+        img.paste(self._base_img)
+
+        # Header: track name (bar is part of the base image)
+        draw_text(
+            img, (WIDTH // 2, 10),
             f"Sends: {track.name}",
             fill=TEXT, font=self._font, anchor="mm",
         )
 
-        # Draw 8 send strips
-        sends = track.sends
+        # Draw 8 send strips (separators are part of the base image) from
+        # the snapshot copies, not the dicts the OSC thread updates
+        sends = state.get_selected_sends()
+        # Fill heights for all visible sends in one vector op
+        volumes = np.array([send.get("volume", 0.0) for send in sends[:8]], dtype=float)
+        fill_heights = (volumes * FADER_H).astype(int).tolist()
         for i in range(8):
             x = i * STRIP_W
             if i < len(sends):
                 send = sends[i]
-                self._draw_send_strip(draw, x, i, send)
+                self._draw_send_strip(img, draw, x, i, send, fill_heights[i])
             else:
-                self._draw_empty_strip(draw, x, i)
-            # Separator
-            draw.line([x + STRIP_W - 1, 20, x + STRIP_W - 1, HEIGHT],
-                      fill=SEPARATOR)
+                self._draw_empty_strip(img, draw, x, i)
 
         return img
 
-    def _draw_send_strip(self, draw: ImageDraw.ImageDraw, x: int,
-                         idx: int, send: dict) -> None:
+    def _draw_send_strip(self, img: Image.Image, draw: ImageDraw.ImageDraw,
+                         x: int, idx: int, send: dict, fill_h: int) -> None:
+        """Draw one send strip; fill_h is the precomputed fader fill height."""
         cx = x + STRIP_W // 2
 
         # Send name
         name = send.get("name", f"Send {idx + 1}")[:12]
-        draw.text((cx, 32), name, fill=TEXT, font=self._font_small, anchor="mm")
+        draw_text(img, (cx, 32), name, fill=TEXT, font=self._font_small, anchor="mm")
 
         # Volume fader
         fader_x = x + 35
         fader_w = 50
-        fader_top = 44
-        fader_bottom = 130
+        fader_top = FADER_TOP
+        fader_bottom = FADER_BOTTOM
 
         draw.rectangle(
             [fader_x, fader_top, fader_x + fader_w, fader_bottom],
             fill=FADER_BG, outline=FADER_BORDER,
         )
 
-        vol = send.get("volume", 0.0)
-        fader_h = fader_bottom - fader_top
-        fill_h = int(vol * fader_h)
         if fill_h > 0:
             draw.rectangle(
                 [fader_x + 1, fader_bottom - fill_h,
@@ -112,12 +130,14 @@ class SendScreen:
             )
 
         # Volume text
+        vol = send.get("volume", 0.0)
         vol_str = send.get("volume_str", f"{vol:.0%}")[:8]
-        draw.text(
-            (cx, fader_bottom + 8), vol_str,
+        draw_text(
+            img, (cx, fader_bottom + 8), vol_str,
             fill=TEXT_DIM, font=self._font_tiny, anchor="mt",
         )
 
-    def _draw_empty_strip(self, draw: ImageDraw.ImageDraw, x: int, idx: int) -> None:
+    def _draw_empty_strip(self, img: Image.Image, draw: ImageDraw.ImageDraw,
+                          x: int, idx: int) -> None:
         cx = x + STRIP_W // 2
-        draw.text((cx, 80), "—", fill=TEXT_DIM, font=self._font_small, anchor="mm")
+        draw_text(img, (cx, 80), "—", fill=TEXT_DIM, font=self._font_small, anchor="mm")
@@ -3,9 +3,20 @@
 Shows clip grid with real-time state from Playtime.
 """
 
+import functools
 import logging
+import threading
+import time
+from typing import Callable
+
+import numpy as np
 from PIL import Image, ImageDraw, ImageFont
 
+from ui.fonts import (
+    FONT_BOLD, FONT_REGULAR, draw_text, get_font, paste_mask, text_mask,
+)
+from ui.widgets import TileGrid
+
 log = logging.getLogger("push2reaper.ui.session_screen")
 
 WIDTH = 960
@@ -27,6 +38,116 @@ STATE_COLORS = {
     4: (255, 220, 50),     # queued
 }
 
+# x of the separator line at the left edge of each column
+_SEPARATOR_XS = np.arange(8) * STRIP_W
+
+# Clip grid geometry
+GRID_TOP = 22
+ROW_H = (HEIGHT - GRID_TOP - 14) // 8
+CELL_W = STRIP_W - 4
+# [x0, y0, x1, y1] of each cell, indexed [row][col]
+_CELL_RECTS = [
+    [[col * STRIP_W + 2, GRID_TOP + row * ROW_H,
+      col * STRIP_W + 2 + CELL_W, GRID_TOP + row * ROW_H + ROW_H - 2]
+     for col in range(8)]
+    for row in range(8)
+]
+# Per-column cell left edge and per-row vertical centre, for cell contents
+_CELL_XS = tuple(col * STRIP_W + 2 for col in range(8))
+_ROW_MID_YS = tuple(GRID_TOP + row * ROW_H + ROW_H // 2 for row in range(8))
+# Clip name space in a cell, and the part of it taken by a play/rec icon
+NAME_MAX_W = CELL_W - 4
+ICON_W = 10
+# Scene numbers with a pre-measured label; higher ones go through draw_text
+SCENE_LABEL_COUNT = 64
+# Play (triangle) and record (circle) icons as masks, top-left at
+# (cell x + 3, row centre - 4); pasted in ICON_COLOR
+ICON_COLOR = (255, 255, 255)
+_PLAY_ICON = Image.new("L", (6, 7), 0)
+ImageDraw.Draw(_PLAY_ICON).polygon([(0, 0), (0, 6), (5, 3)], fill=255)
+_REC_ICON = Image.new("L", (7, 7), 0)
+ImageDraw.Draw(_REC_ICON).ellipse([0, 0, 6, 6], fill=255)
+# Pixel maps for the 64 cells, relative to (0, GRID_TOP), followed by the
+# 8 one-pixel column separators that run through the grid band
+_GRID = TileGrid(
+    WIDTH, 8 * ROW_H,
+    [[x0, y0 - GRID_TOP, x1, y1 - GRID_TOP]
+     for rects in _CELL_RECTS for x0, y0, x1, y1 in rects]
+    + [[i * STRIP_W, 0, i * STRIP_W, 8 * ROW_H - 1] for i in range(8)],
+)
+# Each cell's box within the _GRID image, row-major, for repainting one cell
+_CELL_BOXES = [
+    (x0, y0 - GRID_TOP, x1 + 1, y1 - GRID_TOP + 1)
+    for rects in _CELL_RECTS for x0, y0, x1, y1 in rects
+]
+# Template regions above and below the grid band, which the grid paste
+# fully covers every frame
+_TEMPLATE_BOXES = ((0, 0, WIDTH, GRID_TOP), (0, GRID_TOP + 8 * ROW_H, WIDTH, HEIGHT))
+CELL_OUTLINE = (80, 80, 80)
+CELL_OUTLINE_EMPTY = (40, 40, 40)
+# Cell fill and outline color per state, indexed by the state's int8 byte
+# (negative states land on 128-255), so one gather colors the whole grid:
+# unknown states fill like an empty cell, positive ones get a clip outline
+_FILL_LUT = np.empty((256, 3), dtype=np.uint8)
+_FILL_LUT[:] = STATE_COLORS[0]
+_FILL_LUT[:len(STATE_COLORS)] = [STATE_COLORS[i] for i in range(len(STATE_COLORS))]
+_OUTLINE_LUT = np.empty((256, 3), dtype=np.uint8)
+_OUTLINE_LUT[:] = CELL_OUTLINE_EMPTY
+_OUTLINE_LUT[1:128] = CELL_OUTLINE
+
+
+def _state_grid(clip_states: np.ndarray | list[list[int]] | None) -> np.ndarray:
+    """Copy clip_states into an 8x8 int array, padding missing cells with 0."""
+    if isinstance(clip_states, np.ndarray):
+        # Playtime's get_grid_state() array, normally already 8x8
+        if clip_states.shape == (8, 8):
+            return clip_states.astype(np.int8)
+        grid = np.zeros((8, 8), dtype=np.int8)
+        h, w = min(clip_states.shape[0], 8), min(clip_states.shape[1], 8)
+        grid[:h, :w] = clip_states[:h, :w]
+        return grid
+    grid = np.zeros((8, 8), dtype=np.int8)
+    if clip_states:
+        for row, states in enumerate(clip_states[:8]):
+            n = min(len(states), 8)
+            grid[row, :n] = states[:n]
+    return grid
+
+
+def _frame_key(track_names: list[str], scene_offset: int,
+               clip_states: np.ndarray | list[list[int]] | None = None,
+               clip_names: list[list[str]] | None = None,
+               connected: bool = False,
+               num_columns: int = 0,
+               num_rows: int = 0) -> tuple:
+    """Hashable summary of SessionScreen.render() arguments."""
+    if isinstance(clip_states, np.ndarray):
+        states_key = (clip_states.shape, clip_states.tobytes())
+    else:
+        states_key = tuple(map(tuple, clip_states)) if clip_states else None
+    return (
+        tuple(track_names), scene_offset, states_key,
+        tuple(map(tuple, clip_names)) if clip_names else None,
+        connected, num_columns, num_rows,
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _truncate(text: str, font, max_width: int) -> str:
+    """Truncate text to fit within max_width pixels, adding ellipsis if needed.
+
+    Cached: clip names are re-laid-out only when they change.
+    """
+    bbox = font.getbbox(text)
+    if bbox[2] - bbox[0] <= max_width:
+        return text
+    for i in range(len(text), 0, -1):
+        truncated = text[:i] + ".."
+        bbox = font.getbbox(truncated)
+        if bbox[2] - bbox[0] <= max_width:
+            return truncated
+    return ""
+
 
 class SessionScreen:
     """Renders the session/clip grid view."""
@@ -36,131 +157,316 @@ class SessionScreen:
         self._font_small: ImageFont.FreeTypeFont | None = None
         self._font_tiny: ImageFont.FreeTypeFont | None = None
         self._load_fonts()
+        # Right-anchored scene number labels, index n for scene n + 1
+        self._scene_labels = [
+            text_mask(str(n + 1), self._font_tiny, "rm")
+            for n in range(SCENE_LABEL_COUNT)
+        ]
+        # Header bar and column separators; the header is tinted by
+        # whether Playtime is connected
+        self._base_imgs = {
+            connected: self._build_base(connected) for connected in (False, True)
+        }
+        # Persistent frame buffer: reset from the template each render
+        self._img = self._base_imgs[False].copy()
+        # Inputs of the header names and footer currently in self._img
+        self._template_key: tuple | None = None
+        # Per-rect fill and outline colors handed to _GRID: 64 cells, then
+        # the 8 separators, whose entries never change
+        self._grid_fills = np.empty((72, 3), dtype=np.uint8)
+        self._grid_outlines = np.empty((72, 3), dtype=np.uint8)
+        self._grid_fills[64:] = SEPARATOR
+        self._grid_outlines[64:] = SEPARATOR
+        # (state, clip name) per cell and the scene offset currently drawn
+        # in the grid band of self._img; None until the first full paint
+        self._cell_keys: list[tuple[int, str]] | None = None
+        self._cell_scene_offset = 0
 
     @staticmethod
-    def _truncate(draw: ImageDraw.ImageDraw, text: str, font, max_width: int) -> str:
-        """Truncate text to fit within max_width pixels, adding ellipsis if needed."""
-        bbox = draw.textbbox((0, 0), text, font=font)
-        if bbox[2] - bbox[0] <= max_width:
-            return text
-        for i in range(len(text), 0, -1):
-            truncated = text[:i] + ".."
-            bbox = draw.textbbox((0, 0), truncated, font=font)
-            if bbox[2] - bbox[0] <= max_width:
-                return truncated
-        return ""
+    def _build_base(connected: bool) -> Image.Image:
+        """Pre-render the frame-invariant parts: header bar and separators."""
+        fb = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+        fb[:] = BG
+        fb[:21] = (30, 40, 30) if connected else (40, 30, 30)
+        # All 8 column separators in one strided store
+        fb[20:, _SEPARATOR_XS] = SEPARATOR
+        return Image.fromarray(fb)
 
-    def _load_fonts(self) -> None:
-        try:
-            self._font = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 14
-            )
-            self._font_small = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 11
-            )
-            self._font_tiny = ImageFont.truetype(
-                "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 9
-            )
-        except OSError:
-            self._font = ImageFont.load_default()
-            self._font_small = self._font
-            self._font_tiny = self._font
+    def _build_template(self, track_names: tuple[str, ...], scene_offset: int,
+                        connected: bool, num_columns: int,
+                        num_rows: int) -> Image.Image:
+        """Render the base image plus header track names and footer status.
 
-    def render(self, track_names: list[str], scene_offset: int,
-               clip_states: list[list[int]] | None = None,
-               clip_names: list[list[str]] | None = None,
-               connected: bool = False,
-               num_columns: int = 0,
-               num_rows: int = 0) -> Image.Image:
-        img = Image.new("RGB", (WIDTH, HEIGHT), BG)
-        draw = ImageDraw.Draw(img)
+        Scene numbers stay per-frame: they are drawn over the clip cells,
+        which the grid paste redraws every frame.
+        """
+        img = self._base_imgs[connected].copy()
 
-        # Header with track names
-        header_color = (30, 40, 30) if connected else (40, 30, 30)
-        draw.rectangle([0, 0, WIDTH, 20], fill=header_color)
+        # Header with track names (bar is part of the base image)
         for i in range(8):
             x = i * STRIP_W
             name = track_names[i][:10] if i < len(track_names) else ""
             # Dim tracks beyond Playtime's column count
             color = TEXT if (i < num_columns or not connected) else TEXT_DIM
-            draw.text(
-                (x + STRIP_W // 2, 10), name,
+            draw_text(
+                img, (x + STRIP_W // 2, 10), name,
                 fill=color, font=self._font_small, anchor="mm",
             )
 
-        # Clip grid
-        grid_top = 22
-        row_h = (HEIGHT - grid_top - 14) // 8
-        cell_w = STRIP_W - 4
+        # Footer
+        if connected:
+            status = f"SESSION  |  Scenes {scene_offset + 1}-{scene_offset + 8}  |  Playtime ({num_columns}x{num_rows})"
+        else:
+            status = f"SESSION  |  Scenes {scene_offset + 1}-{scene_offset + 8}  |  No Playtime"
+        draw_text(
+            img, (WIDTH // 2, HEIGHT - 4), status,
+            fill=TEXT_DIM, font=self._font_tiny, anchor="mm",
+        )
+
+        return img
+
+    def _load_fonts(self) -> None:
+        self._font = get_font(FONT_BOLD, 14)
+        self._font_small = get_font(FONT_REGULAR, 11)
+        self._font_tiny = get_font(FONT_REGULAR, 9)
+
+    def render(self, track_names: list[str], scene_offset: int,
+               clip_states: np.ndarray | list[list[int]] | None = None,
+               clip_names: list[list[str]] | None = None,
+               connected: bool = False,
+               num_columns: int = 0,
+               num_rows: int = 0) -> Image.Image:
+        """Render the clip grid.
+
+        Only the chrome and cells whose inputs changed are repainted;
+        SessionScreenAsync skips calls with unchanged arguments entirely.
+        The returned image is a persistent buffer, overwritten by the next
+        render.
+        """
+        img = self._img
 
-        for row in range(8):
-            for col in range(8):
-                x = col * STRIP_W + 2
-                y = grid_top + row * row_h
+        # Header and footer only change with the inputs in this key. Nothing
+        # else draws outside the grid band, so the previous frame's chrome
+        # stays valid and is repainted only when the key changes
+        key = (tuple(track_names[:8]), scene_offset, bool(connected),
+               num_columns, num_rows)
+        if key != self._template_key:
+            template = self._build_template(*key)
+            for box in _TEMPLATE_BOXES:
+                img.paste(template.crop(box), box[:2])
+            self._template_key = key
+
+        # (state, clip name) per cell, row-major
+        states = _state_grid(clip_states)
+        cell_keys = []
+        for row, row_states in enumerate(states.tolist()):
+            row_names = clip_names[row] if clip_names and row < len(clip_names) else ()
+            n = len(row_names)
+            cell_keys.extend(
+                (state, row_names[col] if col < n else "")
+                for col, state in enumerate(row_states)
+            )
 
-                state = 0
-                if clip_states and row < len(clip_states) and col < len(clip_states[row]):
-                    state = clip_states[row][col]
+        # Only cells whose state or name changed are repainted; the rest of
+        # the grid band in self._img is already up to date. Scene numbers
+        # sit on the last column, so a new scene offset repaints it too
+        prev_keys = self._cell_keys
+        if prev_keys is None:
+            dirty = range(64)
+        else:
+            relabel = scene_offset != self._cell_scene_offset
+            dirty = [
+                i for i in range(64)
+                if cell_keys[i] != prev_keys[i] or (relabel and i % 8 == 7)
+            ]
 
-                fill = STATE_COLORS.get(state, STATE_COLORS[0])
+        if dirty:
+            # Clip grid: all 64 cells (fill + outline) and the separators
+            # crossing the grid band in one array write
+            fills = self._grid_fills
+            outlines = self._grid_outlines
+            state_bytes = states.ravel().view(np.uint8)
+            np.take(_FILL_LUT, state_bytes, axis=0, out=fills[:64])
+            np.take(_OUTLINE_LUT, state_bytes, axis=0, out=outlines[:64])
+            grid = _GRID.render(fills, outlines, BG)
+            if prev_keys is None:
+                img.paste(grid, (0, GRID_TOP))
+            else:
+                for i in dirty:
+                    box = _CELL_BOXES[i]
+                    img.paste(grid.crop(box), (box[0], box[1] + GRID_TOP))
 
-                # Draw cell with outline
-                outline = (80, 80, 80) if state > 0 else (40, 40, 40)
-                draw.rectangle([x, y, x + cell_w, y + row_h - 2],
-                               fill=fill, outline=outline)
+        # Loop-invariant lookups, hoisted out of the per-cell loop
+        font = self._font_tiny
+        paste = img.paste
+        scene_labels = self._scene_labels
+        for i in dirty:
+            state, clip_name = cell_keys[i]
+            row, col = divmod(i, 8)
+            mid_y = _ROW_MID_YS[row]
+            # Empty cells carry no text or icon
+            if state > 0:
+                x = _CELL_XS[col]
+                has_icon = state == 2 or state == 3
 
                 # Clip name text
-                clip_name = ""
-                if clip_names and row < len(clip_names) and col < len(clip_names[row]):
-                    clip_name = clip_names[row][col]
-                if clip_name and state > 0:
+                if clip_name:
                     # Truncate to fit cell width (leave room for state icon)
-                    max_w = cell_w - 4
-                    if state in (2, 3):
-                        max_w -= 10  # room for play/rec icon
-                    display_name = self._truncate(draw, clip_name, self._font_tiny, max_w)
-                    text_x = x + 2
-                    if state in (2, 3):
-                        text_x += 10  # after icon
+                    max_w = NAME_MAX_W - ICON_W if has_icon else NAME_MAX_W
+                    display_name = _truncate(clip_name, font, max_w)
+                    text_x = x + 2 + ICON_W if has_icon else x + 2
                     text_color = (255, 255, 255) if state >= 2 else (200, 200, 200)
-                    draw.text(
-                        (text_x, y + row_h // 2), display_name,
-                        fill=text_color, font=self._font_tiny, anchor="lm",
+                    draw_text(
+                        img, (text_x, mid_y), display_name,
+                        fill=text_color, font=font, anchor="lm",
                     )
 
                 # Playing indicator: small triangle (left side)
                 if state == 2:  # playing
-                    ix = x + 3
-                    cy = y + row_h // 2 - 1
-                    draw.polygon([(ix, cy - 3), (ix, cy + 3), (ix + 5, cy)],
-                                 fill=(255, 255, 255))
+                    paste(ICON_COLOR, (x + 3, mid_y - 4), _PLAY_ICON)
                 # Recording indicator: small circle (left side)
                 elif state == 3:
-                    ix = x + 3
-                    cy = y + row_h // 2 - 1
-                    draw.ellipse([ix, cy - 3, ix + 6, cy + 3],
-                                 fill=(255, 255, 255))
-
-            # Scene number on right edge
-            draw.text(
-                (WIDTH - 4, grid_top + row * row_h + row_h // 2),
-                str(scene_offset + row + 1),
-                fill=TEXT_DIM, font=self._font_tiny, anchor="rm",
-            )
+                    paste(ICON_COLOR, (x + 3, mid_y - 4), _REC_ICON)
 
-        # Column separators
-        for i in range(8):
-            x = i * STRIP_W
-            draw.line([x, 20, x, HEIGHT], fill=SEPARATOR)
+            # Scene number on right edge, over the row's last cell
+            if col == 7:
+                scene = scene_offset + row
+                if scene < SCENE_LABEL_COUNT:
+                    paste_mask(img, (WIDTH - 4, mid_y), scene_labels[scene], TEXT_DIM)
+                else:
+                    draw_text(
+                        img, (WIDTH - 4, mid_y), str(scene + 1),
+                        fill=TEXT_DIM, font=font, anchor="rm",
+                    )
 
-        # Footer
-        if connected:
-            status = f"SESSION  |  Scenes {scene_offset + 1}-{scene_offset + 8}  |  Playtime ({num_columns}x{num_rows})"
-        else:
-            status = f"SESSION  |  Scenes {scene_offset + 1}-{scene_offset + 8}  |  No Playtime"
-        draw.text(
-            (WIDTH // 2, HEIGHT - 4), status,
-            fill=TEXT_DIM, font=self._font_tiny, anchor="mm",
+        self._cell_keys = cell_keys
+        self._cell_scene_offset = scene_offset
+        return img
+
+
+# Seconds between log lines reporting renders dropped because the worker
+# was still busy with an earlier frame
+DROP_LOG_INTERVAL = 10.0
+
+
+class SessionScreenAsync:
+    """Runs SessionScreen.render() on a worker thread.
+
+    The display loop submits the latest render arguments and sends the
+    newest finished frame, so a slow render shows up one frame late
+    instead of stalling the loop. Only the most recent arguments are
+    kept; the frame handed out is a copy, never the buffer being drawn.
+    A convert function (e.g. push2.display.pil_to_bgr565) can stand in
+    for the copy, so the worker hands out frames already packed for the
+    display and the loop skips the conversion for unchanged frames.
+    Arguments replaced before the worker got to them count as dropped
+    frames, logged every DROP_LOG_INTERVAL seconds while drops happen.
+    """
+
+    def __init__(self, convert: Callable[[Image.Image], object] = Image.Image.copy):
+        self._screen = SessionScreen()
+        self._convert = convert
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._pending: tuple[tuple, dict] | None = None  # (args, kwargs)
+        self._last_key: tuple | None = None  # _frame_key() of self._frame
+        self._blank_frame = convert(Image.new("RGB", (WIDTH, HEIGHT), BG))
+        self._frame = self._blank_frame
+        self._running = False
+        self._thread: threading.Thread | None = None
+        self._dropped = 0  # submissions superseded since the last drop log
+        self._drop_log_time = time.monotonic()
+
+    def start(self) -> None:
+        """Start the render thread."""
+        if self._running:
+            return
+        if self._thread is not None:
+            # The previous worker outlived stop()'s join timeout; wait for
+            # it so two workers never draw into the same SessionScreen
+            self._thread.join()
+            self._thread = None
+        self._running = True
+        self._thread = threading.Thread(
+            target=self._run,
+            name="session-render",
+            daemon=True,
         )
+        self._thread.start()
 
-        return img
+    def stop(self) -> None:
+        """Stop the render thread and wait for it to exit.
+
+        Also forgets the last frame, so latest() is black until the first
+        render after the next start().
+        """
+        with self._lock:
+            self._running = False
+            self._pending = None
+            self._frame = self._blank_frame
+            self._last_key = None
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            if self._thread.is_alive():
+                log.warning("Session render thread still busy after stop")
+            else:
+                self._thread = None
+
+    def submit(self, *args, **kwargs) -> None:
+        """Queue a render with SessionScreen.render() arguments.
+
+        Replaces any submitted arguments the worker hasn't picked up yet,
+        counting them as a dropped frame.
+        """
+        with self._lock:
+            if self._pending is not None:
+                self._dropped += 1
+            self._pending = (args, kwargs)
+        self._wake.set()
+
+    def latest(self):
+        """The most recently finished frame, passed through convert.
+
+        Black before the first render since start().
+        """
+        return self._frame
+
+    def _run(self) -> None:
+        while self._running:
+            self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                job, self._pending = self._pending, None
+            if job is None:
+                continue
+            key = _frame_key(*job[0], **job[1])
+            if key == self._last_key:
+                continue
+            try:
+                img = self._screen.render(*job[0], **job[1])
+            except Exception:
+                log.exception("Session render error")
+                continue
+            frame = self._convert(img)
+            with self._lock:
+                # Don't publish a frame finished after stop()
+                if not self._running:
+                    break
+                self._frame = frame
+                self._last_key = key
+            self._log_drops()
+
+    def _log_drops(self) -> None:
+        """Log the dropped frame rate once DROP_LOG_INTERVAL has passed."""
+        now = time.monotonic()
+        elapsed = now - self._drop_log_time
+        if elapsed < DROP_LOG_INTERVAL:
+            return
+        with self._lock:
+            dropped, self._dropped = self._dropped, 0
+        self._drop_log_time = now
+        if dropped:
+            log.warning("Session render dropped %d frames in %.0fs "
+                        "(%.1f/s); rendering can't keep up with the display",
+                        dropped, elapsed, dropped / elapsed)
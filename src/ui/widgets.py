@@ -1 +1,63 @@
-"""UI widget library — stub for Phase 2."""
+"""UI widget library.
+
+TileGrid: a fixed layout of outlined rectangular cells (clip slots, drum
+pads, steps) rendered in one NumPy gather instead of a draw.rectangle()
+per cell.
+"""
+
+import numpy as np
+from PIL import Image
+
+
+class TileGrid:
+    """Pixel maps for a fixed set of non-overlapping rectangles.
+
+    rects are inclusive [x0, y0, x1, y1] boxes (as ImageDraw.rectangle
+    takes them) relative to the grid's own origin. Pixels outside every
+    rect show the background color.
+    """
+
+    def __init__(self, width: int, height: int, rects: list[list[int]]):
+        self.size = (width, height)
+        self._count = len(rects)
+        # Cell index per pixel (count = background) and outline mask
+        cell = np.full((height, width), self._count, dtype=np.intp)
+        edge = np.zeros((height, width), dtype=bool)
+        for i, (x0, y0, x1, y1) in enumerate(rects):
+            cell[y0:y1 + 1, x0:x1 + 1] = i
+            edge[y0:y1 + 1, x0:x1 + 1] = True
+            edge[y0 + 1:y1, x0 + 1:x1] = False
+        # Row of each pixel in the color table built by render(): fills and
+        # background first, then the same again for outline pixels
+        self._index = cell + edge * (self._count + 1)
+        # 4 bytes per pixel so Pillow can share the buffer: "RGBX" images
+        # from frombuffer() are views, "RGB" ones are copies
+        self._lut = np.zeros((2 * (self._count + 1), 4), dtype=np.uint8)
+        self._pixels = np.zeros((height, width, 4), dtype=np.uint8)
+        self._image = Image.frombuffer("RGBX", self.size, self._pixels,
+                                       "raw", "RGBX", 0, 1)
+
+    def render(self, fills, outlines=None,
+               bg: tuple = (0, 0, 0)) -> Image.Image:
+        """Render the grid.
+
+        Args:
+            fills: One RGB color per rect, as an (N, 3) array or sequence
+            outlines: One RGB outline color per rect, or None for no outline
+            bg: Color outside the rects
+
+        Returns an "RGBX" image with the same pixels as drawing each rect
+        with draw.rectangle(rect, fill=fill, outline=outline), ready to
+        paste into an RGB frame. It is a view of the grid's own buffer and
+        is overwritten by the next render(), so paste it rather than keep
+        it, and don't render one grid from two threads at once.
+        """
+        n = self._count
+        lut = self._lut[:, :3]
+        lut[:n] = fills
+        lut[n + 1:2 * n + 1] = fills if outlines is None else outlines
+        lut[n] = lut[-1] = bg
+        # One gather for fills and outlines alike, straight into the
+        # buffer behind self._image
+        np.take(self._lut, self._index, axis=0, out=self._pixels)
+        return self._image
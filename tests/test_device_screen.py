@@ -0,0 +1,55 @@
+import unittest
+
+import numpy as np
+
+from reaper.state import ReaperState
+from ui.device_screen import DeviceScreen, compute_knob_geometry
+
+
+class NeedsRedrawTest(unittest.TestCase):
+
+    def setUp(self):
+        self.state = ReaperState()
+        self.state.update_fx(1, 0, name="EQ")
+        self.screen = DeviceScreen()
+        self.screen.render(self.state, 1, 0, 0)
+
+    def test_param_for_new_fx_updates_header(self):
+        # A param for FX 2 creates it, so the header must read "FX 1/2"
+        self.state.update_fx_param(1, 1, 0, value=0.5)
+        self.assertTrue(self.screen.needs_redraw([("fx_param", 1, 1, 0)], 1, 0))
+        self.screen.invalidate()
+        frame = self.screen.render(self.state, 1, 0, 0)
+        expected = DeviceScreen().render(self.state, 1, 0, 0)
+        self.assertEqual(frame.tobytes(), expected.tobytes())
+
+    def test_param_for_other_drawn_fx_is_ignored(self):
+        self.state.update_fx(1, 1, name="Comp")
+        self.screen.invalidate()
+        self.screen.render(self.state, 1, 0, 0)
+        self.assertFalse(self.screen.needs_redraw([("fx_param", 1, 1, 0)], 1, 0))
+        self.assertFalse(self.screen.needs_redraw([("fx_param", 2, 0, 0)], 1, 0))
+
+    def test_fx_record_for_track(self):
+        self.assertTrue(self.screen.needs_redraw([("fx", 1, 3)], 1, 0))
+
+
+class KnobGeometryTest(unittest.TestCase):
+
+    def test_dot_within_one_pixel_of_exact_angle(self):
+        # The angle table rounds down to whole degrees; the dot may move
+        # by at most one pixel against the exact angle
+        values = np.linspace(0.0, 1.0, 10001)
+        cx, cy, r = 60, 78, 22
+        dot_x, dot_y, _ = compute_knob_geometry(
+            values, np.full(len(values), cx), cy, r,
+        )
+        angles = np.radians(135 + values * 270)
+        exact_x = cx + ((r - 2) * np.cos(angles)).astype(int)
+        exact_y = cy + ((r - 2) * np.sin(angles)).astype(int)
+        self.assertLessEqual(np.abs(dot_x - exact_x).max(), 1)
+        self.assertLessEqual(np.abs(dot_y - exact_y).max(), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+import unittest
+
+from reaper.osc_client import ReaperOSCClient
+
+
+class _RecordingClient:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, message) -> None:
+        self.sent.append(message.dgram)
+
+
+class SendConstTest(unittest.TestCase):
+
+    def test_equal_args_of_different_types_keep_their_type_tags(self):
+        client = ReaperOSCClient()
+        client._client = recorder = _RecordingClient()
+        for value in (0, 0.0, False, 1, 1.0, True):
+            client._send_const("/test/value", value)
+        tags = [dgram[12:16] for dgram in recorder.sent]  # after "/test/value\0"
+        self.assertEqual(tags, [b",i\0\0", b",f\0\0", b",F\0\0",
+                                b",i\0\0", b",f\0\0", b",T\0\0"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,210 @@
+import unittest
+
+from pythonosc.osc_bundle_builder import IMMEDIATELY, OscBundleBuilder
+from pythonosc.osc_message import OscMessage, ParseError
+from pythonosc.osc_message_builder import OscMessageBuilder
+
+from reaper import osc_server
+from reaper.osc_server import ReaperOSCServer, TemplateDispatcher
+from reaper.state import ReaperState
+from ui import screens
+
+
+def _datagram(address: str, *args) -> bytes:
+    builder = OscMessageBuilder(address)
+    for arg in args:
+        builder.add_arg(arg)
+    return builder.build().dgram
+
+
+class ServerTestCase(unittest.TestCase):
+    """Feeds raw datagrams through a dispatcher set up by ReaperOSCServer."""
+
+    def setUp(self):
+        self.state = ReaperState()
+        self.server = ReaperOSCServer(port=0, state=self.state)
+        self.dispatcher = TemplateDispatcher()
+        self.server._setup_handlers(self.dispatcher)
+        self.state.flush_changes()
+
+    def send(self, address: str, *args) -> None:
+        self.dispatcher.call_handlers_for_packet(
+            _datagram(address, *args), ("127.0.0.1", 9000))
+
+    def pending(self) -> set:
+        return self.state._pending_changes
+
+
+class QuantizedFeedbackTest(ServerTestCase):
+
+    def test_steps_match_mixer_geometry(self):
+        steps = osc_server._QUANTIZED_STEPS
+        self.assertEqual(steps["vu"], screens.FADER_H)
+        self.assertEqual(steps["pan"], screens.PAN_W)
+        self.assertEqual(osc_server._VU_HOT, screens.VU_HOT)
+
+    def test_same_pixel_stores_value_without_change(self):
+        self.send("/track/1/vu", 0.5)
+        self.state.flush_changes()
+        self.send("/track/1/vu", 0.503)
+        self.assertEqual(self.pending(), set())
+        self.assertAlmostEqual(self.state.tracks[1].vu, 0.503, places=5)
+
+    def test_new_pixel_records_change(self):
+        self.send("/track/1/vu", 0.5)
+        self.state.flush_changes()
+        self.send("/track/1/vu", 0.5 + 1.5 / screens.FADER_H)
+        self.assertEqual(self.pending(), {("track", 1)})
+
+    def test_vu_crossing_hot_level_records_change(self):
+        self.send("/track/1/vu", 0.799)
+        self.state.flush_changes()
+        self.send("/track/1/vu", 0.8005)
+        self.assertEqual(self.pending(), {("track", 1)})
+
+
+class TemplateDispatchTest(ServerTestCase):
+
+    def test_numeric_segments_and_wildcards_share_a_template(self):
+        template = osc_server._address_template
+        self.assertEqual(template("/track/12/vu"), "/track/#/vu")
+        self.assertEqual(template("/track/*/vu"), "/track/#/vu")
+        self.assertEqual(template("/track/3/send/2/volume"), "/track/#/send/#/volume")
+        self.assertEqual(template("/track/*/send/*/volume"), "/track/#/send/#/volume")
+        # Only whole numeric segments are indices
+        self.assertEqual(template("/track/12/fx/1/fxparam/10/value"),
+                         "/track/#/fx/#/fxparam/#/value")
+        self.assertEqual(template("/tempo/raw"), "/tempo/raw")
+        self.assertEqual(template("/vu/L2"), "/vu/L2")
+
+    def test_datagrams_reach_the_mapped_handler(self):
+        self.send("/track/12/volume", 0.25)
+        self.send("/track/12/name", "Bass")
+        self.send("/track/12/mute", 1.0)
+        track = self.state.tracks[12]
+        self.assertAlmostEqual(track.volume, 0.25)
+        self.assertEqual(track.name, "Bass")
+        self.assertTrue(track.mute)
+        self.assertEqual(self.pending(), {("track", 12)})
+
+    def test_send_volume_does_not_hit_track_volume(self):
+        volume = self.state.tracks[3].volume
+        self.send("/track/3/send/2/volume", 0.4)
+        self.assertEqual(self.state.tracks[3].volume, volume)
+        self.assertAlmostEqual(self.state.tracks[3].sends[1]["volume"], 0.4)
+        self.assertEqual(self.pending(), {("send", 3, 1)})
+
+
+class FastPathTest(ServerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        # Addresses that fell through to the template lookup
+        self.looked_up = []
+        lookup = self.dispatcher.handlers_for_address
+
+        def handlers_for_address(address):
+            self.looked_up.append(address)
+            return lookup(address)
+
+        self.dispatcher.handlers_for_address = handlers_for_address
+
+    def test_meter_addresses_skip_the_lookup(self):
+        self.send("/track/4/vu", 0.3)
+        self.send("/track/4/vu/L", 0.4)
+        self.send("/track/4/vu/R", 0.6)
+        track = self.state.tracks[4]
+        self.assertAlmostEqual(track.vu, 0.3)
+        self.assertAlmostEqual(track.vu_l, 0.4)
+        self.assertAlmostEqual(track.vu_r, 0.6)
+        self.assertEqual(self.looked_up, [])
+        self.assertEqual(self.pending(), {("track", 4)})
+
+    def test_non_float_meter_still_takes_the_fast_path(self):
+        self.send("/track/4/vu/L", 1)
+        self.assertAlmostEqual(self.state.tracks[4].vu_l, 1.0)
+        self.assertEqual(self.looked_up, [])
+
+    def test_other_addresses_fall_through(self):
+        self.send("/track/4/volume", 0.5)
+        self.send("/track/x/vu", 0.5)
+        self.send("/master/vu", 0.5)
+        self.assertEqual(self.looked_up,
+                         ["/track/4/volume", "/track/x/vu", "/master/vu"])
+        self.assertAlmostEqual(self.state.tracks[4].volume, 0.5)
+        self.assertAlmostEqual(self.state.master_vu, 0.5)
+
+
+class FloatParserTest(ServerTestCase):
+
+    def test_matches_python_osc(self):
+        # Address lengths 1-8 cover every amount of NUL padding
+        addresses = ["/" + "abcdefg"[:n] for n in range(8)] + ["/track/12/vu/L"]
+        for address in addresses:
+            for value in (0.0, 1.0, -2.5, 0.1, 3.4e38, 1e-45):
+                with self.subTest(address=address, value=value):
+                    dgram = _datagram(address, value)
+                    expected = OscMessage(dgram)
+                    self.assertEqual(osc_server._parse_float_message(dgram),
+                                     (expected.address, expected.params[0]))
+
+    def test_rejects_anything_but_one_float(self):
+        good = _datagram("/a/b", 0.5)
+        bundle = OscBundleBuilder(IMMEDIATELY)
+        bundle.add_content(OscMessage(good))
+        for dgram in (
+            b"", b"/", b"/a", b"/a\0\0", b"/a\0\0,f\0\0",
+            good[:-1], good + b"\0\0\0\0", good.replace(b"\0,f", b",f\0"),
+            b"\xff\xfe\0\0,f\0\0\0\0\0\0",
+            _datagram("/a/b", 1), _datagram("/a/b", "x"),
+            _datagram("/a/b", 0.5, 0.5), bundle.build().dgram,
+        ):
+            with self.subTest(dgram=dgram):
+                self.assertIsNone(osc_server._parse_float_message(dgram))
+
+    def test_malformed_datagrams_fall_back_to_python_osc(self):
+        # python-osc zero-pads short arguments and ignores trailing bytes;
+        # whatever it makes of a packet the fast parser rejects must stand
+        good = _datagram("/track/4/vu", 0.5)
+        for dgram in (b"", b"/", good[:-1], good[:-4], good + b"\0"):
+            with self.subTest(dgram=dgram):
+                try:
+                    expected = OscMessage(dgram).params[0]
+                except ParseError:
+                    expected = 0.125
+                self.state.tracks[4].vu = 0.125
+                self.dispatcher.call_handlers_for_packet(dgram, ("127.0.0.1", 9000))
+                self.assertAlmostEqual(self.state.tracks[4].vu, expected)
+
+    def test_other_type_tags_use_the_generic_parser(self):
+        self.send("/track/4/volume", 1)
+        self.send("/track/4/pan", 0.25, 0.75)
+        self.send("/track/4/vu", True)
+        track = self.state.tracks[4]
+        self.assertAlmostEqual(track.volume, 1.0)
+        self.assertAlmostEqual(track.pan, 0.25)
+        self.assertAlmostEqual(track.vu, 1.0)
+
+    def test_bundled_floats_are_dispatched(self):
+        bundle = OscBundleBuilder(IMMEDIATELY)
+        bundle.add_content(OscMessage(_datagram("/track/4/vu", 0.5)))
+        bundle.add_content(OscMessage(_datagram("/track/5/volume", 0.25)))
+        self.dispatcher.call_handlers_for_packet(bundle.build().dgram,
+                                                 ("127.0.0.1", 9000))
+        self.assertAlmostEqual(self.state.tracks[4].vu, 0.5)
+        self.assertAlmostEqual(self.state.tracks[5].volume, 0.25)
+
+
+class UnknownMessageLogTest(ServerTestCase):
+
+    def test_logs_first_messages_once_then_goes_quiet(self):
+        with self.assertLogs(osc_server.log, level="DEBUG") as logs:
+            for i in range(10):
+                self.send(f"/no/such/address/{i}", 1.0)
+        self.assertEqual(len(logs.records), 6)
+        self.assertTrue(all(r.levelname == "INFO" for r in logs.records))
+        self.assertIn("suppressing", logs.records[-1].getMessage())
+
+
+if __name__ == "__main__":
+    unittest.main()
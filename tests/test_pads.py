@@ -0,0 +1,34 @@
+import unittest
+
+from push2.pads import PadManager
+from push2.scales import LAYOUT_LIST, ScaleState
+
+
+class _FakePads:
+    def set_pad_color(self, pad, color) -> None:
+        pass
+
+
+class _FakePush:
+    pads = _FakePads()
+
+
+class RebuildGridTest(unittest.TestCase):
+
+    def test_colors_match_pad_note_for_every_layout(self):
+        scale = ScaleState()
+        pads = PadManager(_FakePush(), scale)
+        for layout in LAYOUT_LIST:
+            for root, octave in ((0, 0), (7, 1), (11, -2)):
+                with self.subTest(layout=layout, root=root, octave=octave):
+                    scale.set_layout(layout)
+                    scale.set_root(root)
+                    scale.octave_offset = octave
+                    pads.rebuild_grid()
+                    expected = [[scale.note_color(scale.pad_note(r, c))
+                                 for c in range(8)] for r in range(8)]
+                    self.assertEqual(pads._grid_colors, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+import random
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from ui.session_screen import SessionScreen, SessionScreenAsync
+
+
+def _random_frames(seed: int, count: int):
+    """Render arguments that change a few cells, names or the offset at a time."""
+    rng = random.Random(seed)
+    states = np.zeros((8, 8), dtype=np.int8)
+    names = [[""] * 8 for _ in range(8)]
+    tracks = [f"Track {i + 1}" for i in range(8)]
+    scene_offset = 0
+    connected = True
+    for _ in range(count):
+        for _ in range(rng.randrange(4)):
+            row, col = rng.randrange(8), rng.randrange(8)
+            states[row, col] = rng.choice((-1, 0, 1, 2, 3, 4, 7))
+            names[row][col] = rng.choice(("", "Bass", "A much longer clip name"))
+        if rng.random() < 0.2:
+            scene_offset = rng.choice((0, 8, 60, 120))
+        if rng.random() < 0.1:
+            connected = not connected
+        yield (list(tracks), scene_offset, states.copy(),
+               [list(r) for r in names], connected, 8, 16)
+
+
+class IncrementalRenderTest(unittest.TestCase):
+
+    def test_incremental_frames_match_fresh_render(self):
+        screen = SessionScreen()
+        for args in _random_frames(seed=1, count=60):
+            frame = screen.render(*args)
+            expected = SessionScreen().render(*args)
+            self.assertEqual(frame.tobytes(), expected.tobytes())
+
+    def test_unchanged_arguments_leave_frame_untouched(self):
+        screen = SessionScreen()
+        args = next(_random_frames(seed=2, count=1))
+        first = screen.render(*args).tobytes()
+        self.assertEqual(screen.render(*args).tobytes(), first)
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+def _render_threads() -> list[threading.Thread]:
+    return [t for t in threading.enumerate() if t.name == "session-render"]
+
+
+class SessionScreenAsyncTest(unittest.TestCase):
+
+    def setUp(self):
+        self.renderer = SessionScreenAsync()
+        self.addCleanup(self.renderer.stop)
+        self.renders = []
+        render = self.renderer._screen.render
+
+        def counting_render(*args, **kwargs):
+            self.renders.append(args)
+            return render(*args, **kwargs)
+
+        self.renderer._screen.render = counting_render
+
+    def test_latest_is_blank_before_first_render(self):
+        blank = self.renderer.latest()
+        self.assertEqual(blank.getbbox(), None)
+        self.renderer.start()
+        self.assertIs(self.renderer.latest(), blank)
+        self.renderer.submit(["A"], 0, [[1]], connected=True)
+        self.assertTrue(_wait_for(lambda: self.renderer.latest() is not blank))
+        self.renderer.stop()
+        self.assertIs(self.renderer.latest(), blank)
+
+    def test_identical_submissions_are_skipped(self):
+        self.renderer.start()
+        args = (["A"], 0, [[1, 2]], [["Bass", "Drums"]], True, 8, 16)
+        self.renderer.submit(*args)
+        self.assertTrue(_wait_for(lambda: len(self.renders) == 1))
+        for _ in range(5):
+            self.renderer.submit(*args)
+        self.renderer.submit(["B"], *args[1:])
+        self.assertTrue(_wait_for(lambda: len(self.renders) == 2))
+        time.sleep(0.05)
+        self.assertEqual([r[0] for r in self.renders], [["A"], ["B"]])
+
+    def test_restart_never_runs_two_workers(self):
+        # A render outlasting stop()'s join timeout leaves the worker
+        # alive; start() must wait for it before starting another
+        started = threading.Event()
+        release = threading.Event()
+        render = self.renderer._screen.render
+
+        def slow_render(*args, **kwargs):
+            started.set()
+            release.wait(5.0)
+            return render(*args, **kwargs)
+
+        self.renderer._screen.render = slow_render
+        self.renderer.start()
+        self.renderer.submit(["A"], 0)
+        self.assertTrue(started.wait(5.0))
+        first = _render_threads()
+        self.assertEqual(len(first), 1)
+        self.renderer.stop()
+        self.assertTrue(first[0].is_alive())
+
+        threading.Timer(0.1, release.set).start()
+        self.renderer.start()
+        self.assertFalse(first[0].is_alive())
+        self.assertEqual(len(_render_threads()), 1)
+
+        self.renderer.stop()
+        self.assertEqual(_render_threads(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
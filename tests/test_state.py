@@ -0,0 +1,43 @@
+import unittest
+
+from core.event_bus import EventBus
+from reaper.state import ReaperState
+
+
+class FlushChangesTest(unittest.TestCase):
+
+    def setUp(self):
+        bus = EventBus()
+        self.events = []
+        bus.subscribe("state_changed", self.events.append)
+        self.state = ReaperState(event_bus=bus)
+
+    def test_updates_are_merged_into_one_publish(self):
+        self.state.update_track(3, volume=0.5)
+        self.state.update_track(3, pan=0.25)
+        self.state.update_send(3, 0, volume=0.1)
+        self.state.update_transport(playing=True)
+        self.state.update_fx_param(2, 0, 5, value=0.7)
+        self.state.flush_changes()
+        self.assertEqual(self.events, [{
+            "changes": {("track", 3), ("send", 3, 0), ("transport",),
+                        ("fx_param", 2, 0, 5)},
+            "kinds": {"track", "send", "transport", "fx_param"},
+        }])
+
+    def test_empty_flush_publishes_nothing(self):
+        self.state.update_track(1, mute=True)
+        self.state.flush_changes()
+        self.events.clear()
+        self.state.flush_changes()
+        self.assertEqual(self.events, [])
+
+    def test_flush_publishes_snapshot_of_bank(self):
+        self.state.update_track(2, volume=0.5)
+        self.assertNotEqual(self.state.get_bank_levels()["volume"][1], 0.5)
+        self.state.flush_changes()
+        self.assertEqual(self.state.get_bank_levels()["volume"][1], 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()